@@ -1,15 +1,85 @@
 import json
 import sqlite3
-from definitions import MANGA_JSON, DB_PATH
+from definitions import MANGA_JSON, DB_PATH, GENRE_BLACKLIST, open_db
+
+try:
+    import orjson  # C JSON parser: 2-5x faster on a multi-MB dataset file
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # streaming parser: O(1) memory for datasets beyond RAM headroom
+except ImportError:
+    ijson = None
+
+BL_LOWER = {g.lower() for g in GENRE_BLACKLIST}
+INSERT_BATCH_SIZE = 1000
 
 def load_json_data():
+    if orjson is not None:
+        return orjson.loads(MANGA_JSON.read_bytes())
     with open(MANGA_JSON, "r", encoding="utf-8") as f:
         return json.load(f)
 
+def iter_entries():
+    """Yield dataset entries one at a time.
+
+    With ijson installed the file is stream-parsed, so neither the raw JSON
+    text nor the full list of entry dicts is ever held in memory; otherwise
+    fall back to parsing the whole document at once.
+    """
+    if ijson is not None:
+        with open(MANGA_JSON, "rb") as f:
+            yield from ijson.items(f, "item")
+    else:
+        yield from load_json_data()
+
+def make_row(entry):
+    """Flatten one dataset entry into its manga INSERT tuple."""
+    user_data = entry.get("user_data", {})
+    return (
+        entry.get("mal_id"),
+        entry.get("title"),
+        entry.get("type"),
+        entry.get("score"),
+        entry.get("chapters"),
+        entry.get("volumes"),
+        entry.get("status"),
+        ", ".join(g.get("name", "") for g in entry.get("genres", [])),
+        entry.get("synopsis", ""),
+        json.dumps(entry.get("images", {})),
+        (entry.get("images", {}).get("jpg") or {}).get("image_url"),
+        entry.get("published", {}).get("from", None),
+        user_data.get("score", None),
+        user_data.get("read", 0),
+        user_data.get("dropped", 0),
+        user_data.get("not_interested", 0),
+        int(any(g.get("name", "").lower() in BL_LOWER for g in entry.get("genres", []))),
+    )
+
+def make_genre_rows(entry):
+    """(mal_id, genre) pairs for the bridge table."""
+    mal_id = entry.get("mal_id")
+    return [
+        (mal_id, g.get("name", "").strip())
+        for g in entry.get("genres", [])
+        if g.get("name", "").strip()
+    ]
+
 def create_database(data, db_name=DB_PATH):
-    conn = sqlite3.connect(db_name)
+    # isolation_level=None disables the implicit per-statement transactions so
+    # the whole load happens inside one explicit BEGIN/COMMIT (one fsync total).
+    conn = open_db(db_name, isolation_level=None)
     cursor = conn.cursor()
 
+    # This is a throwaway rebuild: durability only matters at the final
+    # COMMIT, so skip journaling/fsync entirely while loading and restore
+    # WAL (what the GUIs expect) afterwards.
+    cursor.execute("PRAGMA journal_mode=OFF")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA cache_size=-131072")
+
     # Drop existing table
     cursor.execute("DROP TABLE IF EXISTS manga")
 
@@ -26,49 +96,74 @@ def create_database(data, db_name=DB_PATH):
             genres TEXT,
             synopsis TEXT,
             images TEXT,
+            image_url TEXT,
             published_date TEXT,
             user_score REAL,
             read INTEGER,
             dropped INTEGER DEFAULT 0,
-            not_interested INTEGER DEFAULT 0
+            not_interested INTEGER DEFAULT 0,
+            has_blacklisted INTEGER DEFAULT 0,
+            skipped INTEGER DEFAULT 0
         )
     """)
 
+    # The search GUI's title FTS index is external-content over manga, and
+    # dropping manga above also dropped its sync triggers — left in place it
+    # would serve stale rowids forever, since the GUI only rebuilds it when
+    # the table is absent. Drop it so the GUI recreates and repopulates it.
+    cursor.execute("DROP TABLE IF EXISTS manga_fts")
+
+    # Normalized genre bridge so the GUIs can filter by genre with an index
+    # seek instead of `genres LIKE '%X%'` full-table scans.
+    cursor.execute("DROP TABLE IF EXISTS manga_genre")
+    cursor.execute("CREATE TABLE manga_genre (mal_id INTEGER, genre TEXT)")
+
+    manga_sql = """
+        INSERT INTO manga (
+            mal_id, title, type, mean_score, chapters, volumes, status,
+            genres, synopsis, images, image_url, published_date,
+            user_score, read, dropped, not_interested, has_blacklisted
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    genre_sql = "INSERT INTO manga_genre (mal_id, genre) VALUES (?, ?)"
+
+    # Single pass over the entries (works with the streaming ijson source):
+    # accumulate small batches and executemany them, so peak memory stays
+    # bounded regardless of dataset size.
+    cursor.execute("BEGIN EXCLUSIVE")
+    total = 0
+    manga_batch, genre_batch = [], []
     for entry in data:
-        mal_id = entry.get("mal_id")
-        title = entry.get("title")
-        type_ = entry.get("type")
-        mean_score = entry.get("score")
-        chapters = entry.get("chapters")
-        volumes = entry.get("volumes")
-        status = entry.get("status")
-        genres = ", ".join(g.get("name", "") for g in entry.get("genres", []))
-        synopsis = entry.get("synopsis", "")
-        images = json.dumps(entry.get("images", {}))
-        published_date = entry.get("published", {}).get("from", None)
-
-        user_data = entry.get("user_data", {})
-        user_score = user_data.get("score", None)
-        read = user_data.get("read", 0)
-        dropped = user_data.get("dropped", 0)
-        not_interested = user_data.get("not_interested", 0)
-
-        cursor.execute("""
-            INSERT INTO manga (
-                mal_id, title, type, mean_score, chapters, volumes, status,
-                genres, synopsis, images, published_date,
-                user_score, read, dropped, not_interested
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            mal_id, title, type_, mean_score, chapters, volumes, status,
-            genres, synopsis, images, published_date,
-            user_score, read, dropped, not_interested
-        ))
-
-    conn.commit()
+        manga_batch.append(make_row(entry))
+        genre_batch.extend(make_genre_rows(entry))
+        total += 1
+        if len(manga_batch) >= INSERT_BATCH_SIZE:
+            cursor.executemany(manga_sql, manga_batch)
+            cursor.executemany(genre_sql, genre_batch)
+            manga_batch.clear()
+            genre_batch.clear()
+    if manga_batch:
+        cursor.executemany(manga_sql, manga_batch)
+        cursor.executemany(genre_sql, genre_batch)
+
+    cursor.execute("CREATE INDEX idx_mg ON manga_genre(genre, mal_id)")
+    # Covers the full hot predicate of the rating GUI's candidate query so
+    # the scan never has to touch the (synopsis/images-heavy) main table.
+    cursor.execute(
+        "CREATE INDEX idx_manga_hot ON manga"
+        "(type, not_interested, skipped, has_blacklisted, user_score)"
+    )
+    cursor.execute("CREATE INDEX idx_blacklist ON manga(has_blacklisted)")
+    # Filter index for the simple recommender's two queries (equality on
+    # read/dropped, range or NULL check on user_score).
+    cursor.execute("CREATE INDEX idx_manga_state ON manga(read, dropped, user_score)")
+    cursor.execute("COMMIT")
+
+    # Leave the file in WAL mode for the GUIs / updaters.
+    cursor.execute("PRAGMA locking_mode=NORMAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
     conn.close()
-    print(f"✅ Converted {len(data)} entries into {db_name} with 'dropped' and 'not_interested' fields")
+    print(f"✅ Converted {total} entries into {db_name} with 'dropped' and 'not_interested' fields")
 
 if __name__ == "__main__":
-    data = load_json_data()
-    create_database(data)
+    create_database(iter_entries())
@@ -1,92 +1,140 @@
-import sqlite3
-import requests
-import time
-from difflib import get_close_matches
-from definitions import DB_PATH
-
-SEARCH_URL = "https://api.mangadex.org/manga"
-CHAPTER_URL = "https://api.mangadex.org/chapter"
-COMMIT_BATCH_SIZE = 100
-
-def search_manga_id(title):
-    params = {
-        "title": title,
-        "limit": 10
-    }
-    try:
-        response = requests.get(SEARCH_URL, params=params)
-        response.raise_for_status()
-        results = response.json().get("data", [])
-
-        titles = {
-            r["id"]: r["attributes"]["title"].get("en", list(r["attributes"]["title"].values())[0])
-            for r in results
-        }
-
-        best = get_close_matches(title, titles.values(), n=1, cutoff=0.6)
-        if best:
-            best_id = [k for k, v in titles.items() if v == best[0]]
-            return best_id[0] if best_id else None
-
-    except Exception as e:
-        print(f"❌ Search error for '{title}': {e}")
-    return None
-
-def get_latest_chapter(manga_id):
-    params = {
-        "manga": manga_id,
-        "translatedLanguage[]": "en",
-        "order[chapter]": "desc",
-        "limit": 1
-    }
-    try:
-        response = requests.get(CHAPTER_URL, params=params)
-        response.raise_for_status()
-        data = response.json().get("data", [])
-        if data:
-            chapter = data[0]["attributes"].get("chapter")
-            return int(float(chapter)) if chapter and chapter.replace('.', '', 1).isdigit() else None
-    except Exception as e:
-        print(f"❌ Chapter fetch error for manga ID {manga_id}: {e}")
-    return None
-
-def update_manga_chapters():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT mal_id, title, chapters FROM manga WHERE status = 'Publishing'")
-    manga_list = cursor.fetchall()
-
-    updated = 0
-    changes_in_batch = 0
-
-    for idx, (mal_id, title, current) in enumerate(manga_list, start=1):
-        print(f"🔍 Searching MangaDex for '{title}'")
-        manga_id = search_manga_id(title)
-        if manga_id:
-            chapter_count = get_latest_chapter(manga_id)
-            if chapter_count and (current is None or chapter_count > current):
-                print(f"✅ Updating '{title}' to {chapter_count} chapters (was {current})")
-                cursor.execute("UPDATE manga SET chapters = ? WHERE mal_id = ?", (chapter_count, mal_id))
-                updated += 1
-                changes_in_batch += 1
-            else:
-                print(f"➖ No newer chapter count for '{title}'")
-        else:
-            print(f"❌ No match found for '{title}'")
-
-        if changes_in_batch >= COMMIT_BATCH_SIZE:
-            conn.commit()
-            print(f"🗂️ Committed batch of {changes_in_batch} updates at record {idx}")
-            changes_in_batch = 0
-
-        time.sleep(1.2)  # Rate limiting
-
-    if changes_in_batch > 0:
-        conn.commit()
-        print(f"🗂️ Final batch commit of {changes_in_batch} remaining updates.")
-
-    conn.close()
-    print(f"\n✅ Done. Updated {updated} manga entries.")
-
-if __name__ == "__main__":
-    update_manga_chapters()
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from difflib import get_close_matches
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from definitions import DB_PATH, open_db
+
+SEARCH_URL = "https://api.mangadex.org/manga"
+CHAPTER_URL = "https://api.mangadex.org/chapter"
+COMMIT_BATCH_SIZE = 100
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 5  # MangaDex global rate limit
+
+# Shared keep-alive session: TLS handshakes and TCP connects are paid once
+# per pooled connection instead of once per request.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=MAX_WORKERS * 2, pool_maxsize=MAX_WORKERS * 2)
+SESSION.mount("https://", _adapter)
+
+
+class RateLimiter:
+    """Token-bucket style limiter shared by the worker threads."""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(REQUESTS_PER_SECOND)
+
+
+def search_manga_id(title):
+    params = {
+        "title": title,
+        "limit": 10
+    }
+    try:
+        RATE_LIMITER.acquire()
+        response = SESSION.get(SEARCH_URL, params=params)
+        response.raise_for_status()
+        results = response.json().get("data", [])
+
+        titles = {
+            r["id"]: r["attributes"]["title"].get("en", list(r["attributes"]["title"].values())[0])
+            for r in results
+        }
+
+        best = get_close_matches(title, titles.values(), n=1, cutoff=0.6)
+        if best:
+            best_id = [k for k, v in titles.items() if v == best[0]]
+            return best_id[0] if best_id else None
+
+    except Exception as e:
+        print(f"❌ Search error for '{title}': {e}")
+    return None
+
+def get_latest_chapter(manga_id):
+    params = {
+        "manga": manga_id,
+        "translatedLanguage[]": "en",
+        "order[chapter]": "desc",
+        "limit": 1
+    }
+    try:
+        RATE_LIMITER.acquire()
+        response = SESSION.get(CHAPTER_URL, params=params)
+        response.raise_for_status()
+        data = response.json().get("data", [])
+        if data:
+            chapter = data[0]["attributes"].get("chapter")
+            return int(float(chapter)) if chapter and chapter.replace('.', '', 1).isdigit() else None
+    except Exception as e:
+        print(f"❌ Chapter fetch error for manga ID {manga_id}: {e}")
+    return None
+
+def fetch_chapter_count(mal_id, title, current):
+    """Search + chapter lookup for one manga; returns (mal_id, title, current, count)."""
+    manga_id = search_manga_id(title)
+    if not manga_id:
+        return mal_id, title, current, None
+    return mal_id, title, current, get_latest_chapter(manga_id)
+
+def update_manga_chapters():
+    conn = open_db(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("SELECT mal_id, title, chapters FROM manga WHERE status = 'Publishing'")
+    manga_list = cursor.fetchall()
+
+    updated = 0
+    pending = []  # (chapter_count, mal_id) tuples flushed in batches
+
+    def flush_pending():
+        # One prepared statement and one transaction per batch instead of a
+        # separate parse + commit per row.
+        cursor.execute("BEGIN")
+        cursor.executemany("UPDATE manga SET chapters = ? WHERE mal_id = ?", pending)
+        cursor.execute("COMMIT")
+        print(f"🗂️ Committed batch of {len(pending)} updates")
+        pending.clear()
+
+    # Overlap the two round-trips per title across a small thread pool;
+    # RATE_LIMITER keeps the aggregate request rate under the API limit.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(fetch_chapter_count, mal_id, title, current)
+            for mal_id, title, current in manga_list
+        ]
+        for future in as_completed(futures):
+            mal_id, title, current, chapter_count = future.result()
+            if chapter_count and (current is None or chapter_count > current):
+                print(f"✅ Updating '{title}' to {chapter_count} chapters (was {current})")
+                pending.append((chapter_count, mal_id))
+                updated += 1
+            else:
+                print(f"➖ No update for '{title}'")
+
+            if len(pending) >= COMMIT_BATCH_SIZE:
+                flush_pending()
+
+    if pending:
+        flush_pending()
+
+    conn.close()
+    print(f"\n✅ Done. Updated {updated} manga entries.")
+
+if __name__ == "__main__":
+    update_manga_chapters()
@@ -4,6 +4,8 @@ Centralized configuration for the Manga Recommendation system.
 Uses pathlib for consistent, cross-platform paths.
 """
 
+import os
+import sqlite3
 from pathlib import Path
 
 # -------------------------
@@ -20,6 +22,8 @@ MODEL_PATH: Path = PROJECT_ROOT / "data" / "rf_manga_model.pkl"
 SKIPPED_FILE: Path = PROJECT_ROOT / "data" / "skipped.json"
 WEIGHTS_FILE: Path = PROJECT_ROOT / "data" / "weights.json"
 LABELED_DATA_FILE: Path = PROJECT_ROOT / "data" / "labeled_data.csv"
+COVER_CACHE_DIR: Path = PROJECT_ROOT / "data" / "covers"
+SCORE_CACHE_FILE: Path = PROJECT_ROOT / "data" / "rf_score_cache.pkl"
 
 # -------------------------
 # Constants
@@ -27,6 +31,26 @@ LABELED_DATA_FILE: Path = PROJECT_ROOT / "data" / "labeled_data.csv"
 FIELDS: str = "title,mean,genres,status,num_volumes"
 DEFAULT_OUTPUT_FILE: Path = PROJECT_ROOT / "data" / "manga_dataset.json"
 
+# -------------------------
+# Database helper
+# -------------------------
+def open_db(path: Path = DB_PATH, **kwargs) -> sqlite3.Connection:
+    """
+    Open a SQLite connection with the project-wide performance pragmas.
+
+    WAL + synchronous=NORMAL drops the double fsync per COMMIT and lets the
+    GUIs keep reading while a writer commits; busy_timeout avoids spurious
+    "database is locked" errors when two tools touch the DB at once.
+    """
+    # Convert Path objects once up front instead of per connect call.
+    conn = sqlite3.connect(os.fspath(path), **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
 # Genres we explicitly exclude from training/recommendations
 GENRE_BLACKLIST = {
     "Avant Garde",
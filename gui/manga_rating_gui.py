@@ -4,8 +4,10 @@ import io
 import json
 import logging
 import os
-import random
+import re
 import sqlite3
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Sequence, Tuple
 
@@ -16,7 +18,7 @@ from requests.adapters import HTTPAdapter
 from tkinter import messagebox, scrolledtext, ttk
 from urllib3.util.retry import Retry
 
-from definitions import DB_PATH, SKIPPED_FILE, GENRE_BLACKLIST
+from definitions import DB_PATH, SKIPPED_FILE, GENRE_BLACKLIST, COVER_CACHE_DIR, open_db
 
 # -------------------------
 # Logging
@@ -33,6 +35,8 @@ class AppConfig:
     img_size: Tuple[int, int] = (150, 220)
     user_agent: str = "MangaRater/1.0"
     sample_batch: int = 20  # how many items to enqueue per refresh
+    prefetch_ahead: int = 3  # covers decoded in advance of being shown
+    cover_cache_size: int = 128  # decoded thumbnails kept in memory (LRU)
 
 CONFIG = AppConfig()
 
@@ -42,7 +46,17 @@ READ_CHOICES: List[Tuple[str, int]] = [
     ("-1 - Finished", -1),
 ]
 READ_DISP_TO_VAL = {d: v for d, v in READ_CHOICES}
+
+DROP_CHOICES: List[Tuple[str, int]] = [
+    ("Not Dropped", 0),
+    ("Dropped", 1),
+    ("Dropped but would pick back up", 2),
+]
+DROP_DISP_TO_VAL = {d: v for d, v in DROP_CHOICES}
 BL_LOWER = {g.lower() for g in GENRE_BLACKLIST}
+# Compiled alternation: matches in C and stops at the first hit, with no
+# per-row list allocation from splitting the genre string.
+BL_RE = re.compile("|".join(re.escape(g) for g in GENRE_BLACKLIST), re.IGNORECASE)
 
 
 def _split_genres(s: Optional[str]) -> List[str]:
@@ -54,7 +68,37 @@ def _split_genres(s: Optional[str]) -> List[str]:
 
 def _has_blacklisted(genres_str: Optional[str]) -> bool:
     """Return True if any blacklisted genre appears (case-insensitive)."""
-    return any(g.lower() in BL_LOWER for g in _split_genres(genres_str))
+    return bool(BL_RE.search(genres_str)) if genres_str else False
+
+
+# -------------------------
+# Hot SQL (module constants: one string object each, so the sqlite3
+# statement cache keys on identical text every call)
+# -------------------------
+SQL_CANDIDATES = """
+    SELECT m.mal_id, m.title, m.mean_score, m.genres,
+           m.user_score, m.read
+    FROM manga m
+    JOIN manga_genre g ON g.mal_id = m.mal_id
+    WHERE m.type = ?
+      AND g.genre = ?
+      AND (m.user_score IS NULL OR m.user_score = '')
+      AND m.not_interested = 0
+      AND m.skipped = 0
+      AND m.has_blacklisted = 0
+      AND NOT EXISTS (SELECT 1 FROM excl e WHERE e.mal_id = m.mal_id)
+    ORDER BY random()
+    LIMIT ?
+"""
+
+SQL_SAVE_RATING = """
+    UPDATE manga
+    SET user_score = ?, read = ?, dropped = ?, not_interested = ?
+    WHERE mal_id = ?
+"""
+
+SQL_SKIP = "UPDATE manga SET skipped = 1 WHERE mal_id = ?"
+SQL_COUNTERS = "SELECT SUM(read != 0), SUM(not_interested = 1) FROM manga"
 
 
 class MangaRater:
@@ -63,7 +107,16 @@ class MangaRater:
     def __init__(self) -> None:
         # --- DB
         try:
-            self.conn = sqlite3.connect(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
+            # cached_statements keeps the hot SELECT/UPDATE statements compiled
+            # across calls (sqlite3 keys its statement cache on SQL text).
+            # isolation_level=None: no implicit transactions; writes are
+            # wrapped explicitly in short BEGIN IMMEDIATE blocks below.
+            self.conn = open_db(
+                DB_PATH,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                cached_statements=100,
+                isolation_level=None,
+            )
             self.cursor = self.conn.cursor()
             logger.info("Connected to DB %s", DB_PATH)
         except Exception as e:
@@ -78,11 +131,44 @@ class MangaRater:
         self.http.mount("http://", adapter)
         self.http.mount("https://", adapter)
 
+        # Older DBs predate the normalized genre bridge; build it once here so
+        # every genre query below can use the covering index.
+        if not self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'manga_genre'"
+        ).fetchone():
+            self._build_genre_bridge()
+        # Newer schemas precompute a blacklist flag and a plain image_url
+        # column; probe once and backfill what can be derived in place.
+        manga_cols = {row[1] for row in self.cursor.execute("PRAGMA table_info(manga)")}
+        self.has_image_url_col = "image_url" in manga_cols
+        if "has_blacklisted" not in manga_cols:
+            self._migrate_blacklist_column()
+        if "skipped" not in manga_cols:
+            self._migrate_skipped_column()
+
+        # Cover the whole hot predicate (older DBs carry a narrower index
+        # that predates the skipped/has_blacklisted columns).
+        self.cursor.execute("DROP INDEX IF EXISTS idx_manga_type")
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_manga_hot ON manga"
+            "(type, not_interested, skipped, has_blacklisted, user_score)"
+        )
+
+        # Session-local exclusion set, kept inside the engine: the candidate
+        # query anti-joins this instead of receiving an ever-growing list of
+        # ids from Python on every refill.
+        self.cursor.execute("CREATE TEMP TABLE excl (mal_id INTEGER PRIMARY KEY)")
+
         # --- State
-        self.shown_ids: set[int] = set()
         self.manga_queue: List[Tuple] = []
         self.current_manga: Optional[Tuple] = None
-        self.skipped = self.load_skipped()
+        # LRU of decoded cover thumbnails keyed by mal_id: filled by the
+        # prefetcher and on first display, so revisits skip disk and decode.
+        self.decoded_covers: OrderedDict[int, Image.Image] = OrderedDict()
+
+        # Counters scanned once here, then maintained incrementally on save
+        # instead of re-counting the table after every click.
+        self._read_ct, self._ni_ct = self._query_counters()
 
         # --- UI
         self.root = tk.Tk()
@@ -132,7 +218,7 @@ class MangaRater:
         self.drop_var = tk.StringVar(value="Not Dropped")
         tk.Label(self.root, text="Dropped Status:").pack(pady=(5, 0))
         self.drop_dropdown = ttk.Combobox(self.root, textvariable=self.drop_var, state="readonly", width=28)
-        self.drop_dropdown["values"] = ["Not Dropped", "Dropped", "Dropped but would pick back up"]
+        self.drop_dropdown["values"] = [d for d, _ in DROP_CHOICES]
         self.drop_dropdown.pack(pady=2)
 
         self.not_interested_var = tk.BooleanVar(value=False)
@@ -156,22 +242,53 @@ class MangaRater:
     # -------------------------
     # Persistence of skipped
     # -------------------------
-    def load_skipped(self) -> set[int]:
+    def _build_genre_bridge(self) -> None:
+        """One-time migration: normalize the genres string into manga_genre."""
+        logger.info("Building manga_genre bridge for pre-bridge database")
+        pairs = [
+            (mal_id, g)
+            for mal_id, gstr in self.cursor.execute("SELECT mal_id, genres FROM manga").fetchall()
+            for g in _split_genres(gstr)
+        ]
+        self.cursor.execute("BEGIN IMMEDIATE")
+        self.cursor.execute("CREATE TABLE manga_genre (mal_id INTEGER, genre TEXT)")
+        self.cursor.executemany("INSERT INTO manga_genre (mal_id, genre) VALUES (?, ?)", pairs)
+        self.cursor.execute("CREATE INDEX idx_mg ON manga_genre(genre, mal_id)")
+        self.cursor.execute("COMMIT")
+        logger.info("Normalized %d (mal_id, genre) pairs", len(pairs))
+
+    def _migrate_blacklist_column(self) -> None:
+        """One-time migration: materialize the blacklist check as a flag column."""
+        flagged = [
+            (mal_id,)
+            for mal_id, gstr in self.cursor.execute("SELECT mal_id, genres FROM manga").fetchall()
+            if _has_blacklisted(gstr)
+        ]
+        self.cursor.execute("ALTER TABLE manga ADD COLUMN has_blacklisted INTEGER DEFAULT 0")
+        self.cursor.execute("BEGIN IMMEDIATE")
+        self.cursor.executemany("UPDATE manga SET has_blacklisted = 1 WHERE mal_id = ?", flagged)
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_blacklist ON manga(has_blacklisted)")
+        self.cursor.execute("COMMIT")
+        logger.info("Flagged %d titles with blacklisted genres", len(flagged))
+
+    def _migrate_skipped_column(self) -> None:
+        """Add the skipped column and import the legacy skipped.json once."""
+        self.cursor.execute("ALTER TABLE manga ADD COLUMN skipped INTEGER DEFAULT 0")
+        legacy: set[int] = set()
         if os.path.exists(SKIPPED_FILE):
             try:
                 with open(SKIPPED_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return {int(x) for x in data}
+                    legacy = {int(x) for x in json.load(f)}
             except Exception as e:
-                logger.warning("Failed to load skipped file: %s", e)
-        return set()
-
-    def save_skipped(self) -> None:
-        try:
-            with open(SKIPPED_FILE, "w", encoding="utf-8") as f:
-                json.dump(sorted(self.skipped), f)
-        except Exception as e:
-            logger.warning("Failed to save skipped file: %s", e)
+                logger.warning("Failed to read legacy skipped file: %s", e)
+        if legacy:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            self.cursor.executemany(
+                "UPDATE manga SET skipped = 1 WHERE mal_id = ?",
+                [(mal_id,) for mal_id in legacy],
+            )
+            self.cursor.execute("COMMIT")
+            logger.info("Imported %d skipped ids from %s", len(legacy), SKIPPED_FILE)
 
     # -------------------------
     # DB helpers
@@ -179,13 +296,18 @@ class MangaRater:
     def get_all_genres(self) -> List[str]:
         """Collect all distinct genres, filter out blacklist-only tokens, return sorted."""
         try:
-            self.cursor.execute("SELECT genres FROM manga")
-            genres: set[str] = set()
-            for (gstr,) in self.cursor.fetchall():
-                for g in _split_genres(gstr):
-                    if g and g.lower() not in BL_LOWER:
-                        genres.add(g)
-            vals = sorted(genres)
+            # One covering-index scan over ~100 distinct values instead of
+            # splitting every row's genre string in Python.
+            placeholders = ", ".join("?" for _ in BL_LOWER)
+            self.cursor.execute(
+                f"""
+                SELECT DISTINCT genre FROM manga_genre
+                WHERE lower(genre) NOT IN ({placeholders})
+                ORDER BY genre
+                """,
+                tuple(BL_LOWER),
+            )
+            vals = [g for (g,) in self.cursor.fetchall()]
             logger.info("Discovered %d distinct genres (post-blacklist)", len(vals))
             return vals
         except sqlite3.DatabaseError as e:
@@ -193,15 +315,15 @@ class MangaRater:
             messagebox.showerror("Database Error", f"Failed to load genres: {e}")
             return []
 
+    def _query_counters(self) -> Tuple[int, int]:
+        """Both counters in one table scan; run once at startup."""
+        row = self.cursor.execute(SQL_COUNTERS).fetchone()
+        return (row[0] or 0, row[1] or 0)
+
     def update_read_count(self) -> None:
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM manga WHERE read != 0")
-            read_count = self.cursor.fetchone()[0]
-            self.cursor.execute("SELECT COUNT(*) FROM manga WHERE not_interested = 1")
-            not_interested_count = self.cursor.fetchone()[0]
-            self.read_count_label.config(text=f"Read: {read_count} | Not Interested: {not_interested_count}")
-        except sqlite3.DatabaseError as e:
-            logger.warning("Count update failed: %s", e)
+        self.read_count_label.config(
+            text=f"Read: {self._read_ct} | Not Interested: {self._ni_ct}"
+        )
 
     # -------------------------
     # Core flow
@@ -209,41 +331,19 @@ class MangaRater:
     def load_random_manga(self, reset: bool = False) -> None:
         """Refresh queue with a random sample of candidates for the chosen genre/type."""
         if reset:
-            self.shown_ids.clear()
+            self.cursor.execute("DELETE FROM excl")
             self.manga_queue.clear()
 
         genre = self.genre_var.get()
         type_ = self.type_var.get()
 
-        # SQL pre-filter + Python blacklist guard (belt-and-suspenders)
+        # Index seek on the genre bridge, exclusion and sampling done
+        # server-side: only sample_batch rows cross into Python.
         try:
-            self.cursor.execute(
-                """
-                SELECT mal_id, title, mean_score, genres, user_score, read, images, synopsis
-                FROM manga
-                WHERE type = ?
-                  AND (user_score IS NULL OR user_score = '')
-                  AND not_interested = 0
-                  AND genres LIKE ?
-                """,
-                (type_, f"%{genre}%"),
-            )
-            rows = []
-            for r in self.cursor.fetchall():
-                mal_id, title, mean_score, genres, user_score, read, images, synopsis = r
-                if (
-                    mal_id not in self.shown_ids
-                    and mal_id not in self.skipped
-                    and not _has_blacklisted(genres)  # exclude blacklisted titles
-                ):
-                    rows.append(r)
-
-            if not rows:
-                self.manga_queue.clear()
-            else:
-                k = min(CONFIG.sample_batch, len(rows))
-                # Randomly sample without replacement
-                self.manga_queue.extend(random.sample(rows, k))
+            # Queue only the light columns; images/synopsis (the widest
+            # columns by far) are fetched per-row when a title is displayed.
+            self.cursor.execute(SQL_CANDIDATES, (type_, genre, CONFIG.sample_batch))
+            self.manga_queue.extend(self.cursor.fetchall())
 
             logger.info("Queued %d candidates (genre=%s, type=%s)", len(self.manga_queue), genre, type_)
             self.show_next_manga()
@@ -260,30 +360,24 @@ class MangaRater:
                 return
 
         self.current_manga = self.manga_queue.pop(0)
-        mal_id, title, score, genres, _, _, images_json, synopsis = self.current_manga
-        self.shown_ids.add(mal_id)
+        mal_id, title, score, genres, _, _ = self.current_manga
+        # Excluded from future refills as soon as it's shown; reset clears
+        # the temp table instead of a Python-side set.
+        self.cursor.execute("INSERT OR IGNORE INTO excl VALUES (?)", (mal_id,))
 
-        # Secure JSON parse (no eval) + resilient HTTP
-        img = None
-        try:
-            data = json.loads(images_json or "{}")
-            image_url = (data.get("jpg") or {}).get("image_url")
-            if image_url:
-                resp = self.http.get(image_url, timeout=CONFIG.http_timeout)
-                resp.raise_for_status()
-                img_obj = Image.open(io.BytesIO(resp.content))
-                img_obj = img_obj.resize(CONFIG.img_size, Image.Resampling.LANCZOS)
-                img = ImageTk.PhotoImage(img_obj)
-        except (json.JSONDecodeError, UnidentifiedImageError, requests.RequestException) as e:
-            logger.info("Cover load failed for id=%s: %s", mal_id, e)
-
-        if img is not None:
-            self.cover_label.config(image=img, text="")
-            self.cover_label.image = img
+        image_url, synopsis = self._fetch_display_fields(mal_id)
+
+        if image_url:
+            self.cover_label.config(image=None, text="[Loading image]")
+            self.cover_label.image = None
+            self._load_cover_async(mal_id, image_url)
         else:
             self.cover_label.config(image=None, text="[No Image]")
             self.cover_label.image = None
 
+        # Warm the next few covers so subsequent Save/Skip clicks are instant.
+        self._prefetch_upcoming()
+
         self.info_label.config(
             text=f"Title: {title}\nMAL Score: {score if score is not None else 'N/A'}\nGenres: {genres or 'N/A'}"
         )
@@ -300,33 +394,148 @@ class MangaRater:
         self.not_interested_var.set(False)
         self.update_read_count()
 
+    # -------------------------
+    # Cover loading (disk cache + background fetch)
+    # -------------------------
+    def _image_url_from_field(self, mal_id: int, image_field: Optional[str]) -> Optional[str]:
+        """The image column is a bare URL on new schemas, a JSON blob on old ones."""
+        if self.has_image_url_col:
+            return image_field or None
+        try:
+            return (json.loads(image_field or "{}").get("jpg") or {}).get("image_url")
+        except json.JSONDecodeError as e:
+            logger.info("Bad images JSON for id=%s: %s", mal_id, e)
+            return None
+
+    def _fetch_image_url(self, mal_id: int) -> Optional[str]:
+        """Primary-key lookup of the cover URL for one title."""
+        image_col = "image_url" if self.has_image_url_col else "images"
+        row = self.cursor.execute(
+            f"SELECT {image_col} FROM manga WHERE mal_id = ?", (mal_id,)
+        ).fetchone()
+        return self._image_url_from_field(mal_id, row[0]) if row else None
+
+    def _fetch_display_fields(self, mal_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """Primary-key lookup of the heavy display columns for one title."""
+        image_col = "image_url" if self.has_image_url_col else "images"
+        row = self.cursor.execute(
+            f"SELECT {image_col}, synopsis FROM manga WHERE mal_id = ?", (mal_id,)
+        ).fetchone()
+        if not row:
+            return None, None
+        return self._image_url_from_field(mal_id, row[0]), row[1]
+
+    def _decode_cover(self, mal_id: int, image_url: str) -> Image.Image:
+        """Fetch + decode + resize one cover (worker-thread only; no Tk objects).
+
+        The disk cache stores the *resized* thumbnail keyed by mal_id, so a
+        revisit (or a later app run) is a tiny local JPEG decode with no
+        network fetch and no full-resolution resample.
+
+        BILINEAR is indistinguishable from LANCZOS at thumbnail size and
+        markedly cheaper to compute.
+        """
+        cache_path = COVER_CACHE_DIR / f"{mal_id}.jpg"
+        if cache_path.exists():
+            return Image.open(cache_path).convert("RGB")
+        resp = self.http.get(image_url, timeout=CONFIG.http_timeout)
+        resp.raise_for_status()
+        img_obj = Image.open(io.BytesIO(resp.content))
+        # Ask libjpeg to decode at the nearest fractional DCT scale above the
+        # target size, so most of the full-resolution decode is skipped.
+        img_obj.draft("RGB", CONFIG.img_size)
+        img_obj = img_obj.resize(CONFIG.img_size, Image.Resampling.BILINEAR).convert("RGB")
+        COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        img_obj.save(cache_path, "JPEG", quality=85)
+        return img_obj
+
+    def _load_cover_async(self, mal_id: int, image_url: str) -> None:
+        """Fetch + decode the cover on a worker thread, then apply on the Tk thread."""
+        # Cached already? Apply straight away without touching disk or network.
+        cached = self.decoded_covers.get(mal_id)
+        if cached is not None:
+            self.decoded_covers.move_to_end(mal_id)
+            self._apply_cover(mal_id, cached)
+            return
+
+        def worker():
+            img_obj = None
+            try:
+                img_obj = self._decode_cover(mal_id, image_url)
+                self._cache_decoded(mal_id, img_obj)
+            except (OSError, UnidentifiedImageError, requests.RequestException) as e:
+                logger.info("Cover load failed for id=%s: %s", mal_id, e)
+            self.root.after(0, lambda: self._apply_cover(mal_id, img_obj))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _cache_decoded(self, mal_id: int, img_obj: Image.Image) -> None:
+        """Insert into the decoded-thumbnail LRU, evicting the oldest entry."""
+        self.decoded_covers[mal_id] = img_obj
+        self.decoded_covers.move_to_end(mal_id)
+        while len(self.decoded_covers) > CONFIG.cover_cache_size:
+            self.decoded_covers.popitem(last=False)
+
+    def _prefetch_upcoming(self) -> None:
+        """Decode covers for the next few queued manga before they are shown."""
+        for row in self.manga_queue[: CONFIG.prefetch_ahead]:
+            mal_id = int(row[0])
+            if mal_id in self.decoded_covers:
+                continue
+            url = self._fetch_image_url(mal_id)
+            if not url:
+                continue
+
+            def worker(mal_id=mal_id, url=url):
+                try:
+                    self._cache_decoded(mal_id, self._decode_cover(mal_id, url))
+                except (OSError, UnidentifiedImageError, requests.RequestException) as e:
+                    logger.info("Cover prefetch failed for id=%s: %s", mal_id, e)
+
+            threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_cover(self, mal_id: int, img_obj: Optional[Image.Image]) -> None:
+        """Main-thread callback: ignore results for manga we've already moved past."""
+        if not self.current_manga or int(self.current_manga[0]) != mal_id:
+            return
+        if img_obj is not None:
+            img = ImageTk.PhotoImage(img_obj)  # PhotoImage must be created on the Tk thread
+            self.cover_label.config(image=img, text="")
+            self.cover_label.image = img
+        else:
+            self.cover_label.config(image=None, text="[No Image]")
+            self.cover_label.image = None
+
     def save_and_next(self) -> None:
         if not self.current_manga:
             return
         mal_id = int(self.current_manga[0])
         score = int(self.score_var.get() or 0)
         read_value = READ_DISP_TO_VAL.get(self.read_var.get(), 0)
-        dropped_value = {
-            "Not Dropped": 0,
-            "Dropped": 1,
-            "Dropped but would pick back up": 2,
-        }.get(self.drop_var.get(), 0)
+        dropped_value = DROP_DISP_TO_VAL.get(self.drop_var.get(), 0)
         not_interested = 1 if self.not_interested_var.get() else 0
 
         try:
+            old_read, old_ni = self.cursor.execute(
+                "SELECT read, not_interested FROM manga WHERE mal_id = ?", (mal_id,)
+            ).fetchone() or (0, 0)
+            # BEGIN IMMEDIATE takes the write lock up front, so the commit
+            # can't deadlock on a lock upgrade under WAL.
+            self.cursor.execute("BEGIN IMMEDIATE")
             self.cursor.execute(
-                """
-                UPDATE manga
-                SET user_score = ?, read = ?, dropped = ?, not_interested = ?
-                WHERE mal_id = ?
-                """,
+                SQL_SAVE_RATING,
                 (score if score > 0 else None, read_value, dropped_value, not_interested, mal_id),
             )
-            self.conn.commit()
+            self.cursor.execute("COMMIT")
+            # Adjust the cached counters by the delta of this row.
+            self._read_ct += int(read_value != 0) - int((old_read or 0) != 0)
+            self._ni_ct += not_interested - int(old_ni or 0)
             logger.info("Saved rating for id=%s (score=%s, read=%s, dropped=%s, not_int=%s)",
                         mal_id, score, read_value, dropped_value, not_interested)
         except sqlite3.DatabaseError as e:
             logger.exception("Save failed")
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
             messagebox.showerror("Database Error", f"Save failed: {e}")
             return
 
@@ -336,8 +545,17 @@ class MangaRater:
         if not self.current_manga:
             return
         mal_id = int(self.current_manga[0])
-        self.skipped.add(mal_id)
-        self.save_skipped()
+        try:
+            # One indexed UPDATE instead of rewriting a growing JSON file.
+            self.cursor.execute("BEGIN IMMEDIATE")
+            self.cursor.execute(SQL_SKIP, (mal_id,))
+            self.cursor.execute("COMMIT")
+        except sqlite3.DatabaseError as e:
+            logger.exception("Skip failed")
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
+            messagebox.showerror("Database Error", f"Skip failed: {e}")
+            return
         logger.info("Skipped id=%s", mal_id)
         self.show_next_manga()
 
@@ -345,10 +563,6 @@ class MangaRater:
     # Shutdown
     # -------------------------
     def on_close(self) -> None:
-        try:
-            self.save_skipped()
-        except Exception:
-            pass
         try:
             self.http.close()
         except Exception:
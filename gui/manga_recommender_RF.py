@@ -4,10 +4,15 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import json
 import logging
+import re
 import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional, List, Tuple
 
@@ -21,7 +26,12 @@ from PIL import Image, ImageTk, UnidentifiedImageError
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from definitions import DB_PATH, MODEL_PATH, GENRE_BLACKLIST  # centralized project constants
+from definitions import DB_PATH, MODEL_PATH, SCORE_CACHE_FILE, COVER_CACHE_DIR, GENRE_BLACKLIST, open_db  # centralized project constants
+
+try:
+    import orjson  # C JSON parser: 3-5x faster for the per-row images blobs
+except ImportError:
+    orjson = None
 
 # -----------------------------------------------------------------------------
 # Logging: structured logs help during demos / debugging and look professional
@@ -54,6 +64,8 @@ VAL_TO_DISP = {v: d for d, v in READ_CHOICES}
 
 # Case-insensitive genre blacklist used for both filtering and feature cleaning
 BL_LOWER = {g.lower() for g in GENRE_BLACKLIST}
+# Compiled alternation so the blacklist check is a single C-level scan.
+BL_RE = re.compile("|".join(re.escape(g) for g in GENRE_BLACKLIST), re.IGNORECASE)
 
 # Columns the model pipeline expects in this order
 REQUIRED_COLS = ["type", "genre_list", "mean_score", "chapters", "volumes", "synopsis"]
@@ -65,11 +77,66 @@ def clean_genres_for_inference(raw_list: Optional[List[str]]) -> List[str]:
     """Remove blacklisted genres so the encoder never sees them (prevents unknown-category warnings)."""
     return [g.strip() for g in (raw_list or []) if g and g.strip().lower() not in BL_LOWER]
 
+def extract_image_url(images_json: Optional[str]) -> Optional[str]:
+    """Pull the jpg cover URL out of a Jikan-style images JSON blob."""
+    if not images_json:
+        return None
+    try:
+        data = orjson.loads(images_json) if orjson is not None else json.loads(images_json)
+        return (data.get("jpg") or {}).get("image_url")
+    except (ValueError, AttributeError):
+        return None
+
 def has_blacklisted(genres_str: Optional[str]) -> bool:
     """Return True if any blacklisted genre appears in a comma-separated field (case-insensitive)."""
-    if not genres_str:
-        return False
-    return any(g.strip().lower() in BL_LOWER for g in genres_str.split(","))
+    return bool(BL_RE.search(genres_str)) if genres_str else False
+
+# Hot write path, defined once so sqlite3's statement cache keys on the
+# identical string every save.
+SQL_SAVE_DETAILS = """
+    UPDATE manga
+    SET user_score = ?, read = ?, not_interested = ?
+    WHERE mal_id = ?
+"""
+
+@functools.lru_cache(maxsize=16)
+def rerank_sql(type_filter: bool, include_rated: bool, include_not_interested: bool,
+               has_bl_col: bool, image_col: str) -> str:
+    """The rerank SELECT for one filter combination.
+
+    There are only a handful of concrete shapes; memoizing them returns the
+    same string object each time, so SQLite reuses the prepared statement
+    instead of re-parsing and re-planning per rerank.
+    """
+    where: List[str] = []
+    if type_filter:
+        where.append("type = ?")
+    if not include_rated:
+        where.append("user_score IS NULL")
+    if not include_not_interested:
+        where.append("not_interested = 0")
+    # Blacklisted titles are dropped inside the engine so they never cross
+    # the SQLite->pandas boundary.
+    where.append("has_blacklisted = 0" if has_bl_col else "(genres IS NULL OR NOT has_blacklist(genres))")
+    # user_score/read/not_interested ride along so open_details never has to
+    # issue a per-click SELECT.
+    return f"""
+        SELECT mal_id, title, type, genres, mean_score, chapters, volumes,
+               synopsis, {image_col}, published_date,
+               user_score, read, not_interested
+        FROM manga
+        WHERE {" AND ".join(where)}
+        ORDER BY mal_id ASC
+    """
+
+@dataclass
+class RowWidgets:
+    """One pooled result row: built once, reconfigured on every page flip."""
+    frame: ttk.Frame
+    img_label: tk.Label
+    info_label: tk.Label
+    synopsis_box: scrolledtext.ScrolledText
+
 
 # -----------------------------------------------------------------------------
 # Main App
@@ -87,24 +154,39 @@ class RecommendationApp:
         self.http = requests.Session()
         self.http.headers.update({"User-Agent": CONFIG.user_agent})
         retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=32)
         self.http.mount("http://", adapter)
         self.http.mount("https://", adapter)
 
-        # Cache PhotoImage objects by mal_id to avoid re-fetching and to keep references alive
-        self.img_cache: Dict[int, ImageTk.PhotoImage] = {}
+        # Cover fetch + decode run here; only the PhotoImage construction is
+        # marshalled back to the Tk thread (Tk is not thread-safe).
+        self.io_pool = ThreadPoolExecutor(max_workers=16)
+
+        # LRU of PhotoImage objects by mal_id: avoids re-fetching while
+        # keeping Tk-side image memory bounded on long browsing sessions
+        # (an unbounded dict grows by ~50 KB per title paged past).
+        self.img_cache: OrderedDict[int, ImageTk.PhotoImage] = OrderedDict()
+        self._img_cache_size = 8 * CONFIG.page_size
 
         # ---------------- Load model & DB connections ----------------
         self.model = self._load_model()
         self.conn, self.cursor = self._open_db()
 
+        # Model scores memoized per mal_id: the features never change at
+        # runtime, so filter toggles become a pandas filter+sort instead of a
+        # full predict_proba pass. Persisted across runs keyed by the model
+        # file's identity (retraining rewrites the file, invalidating it).
+        self._score_cache: Dict[int, float] = self._load_score_cache()
+
         # ---------------- UI state ----------------
         self.selected_type = tk.StringVar(value="")      # optional filter by type
         self.include_rated = tk.BooleanVar(value=False)  # by default, hide already-rated items
         self.include_not_interested = tk.BooleanVar(value=False)  # hide explicit opt-outs
 
         self.ranked_df: Optional[pd.DataFrame] = None  # the current ranked dataset
+        self._rank_source: Optional[pd.DataFrame] = None  # full frame when ranked_df is a top-K window
         self.page = 0                                   # active page index
+        self._rank_gen = 0                              # invalidates in-flight background scoring
 
         # Build static UI widgets
         self._build_controls()
@@ -125,6 +207,11 @@ class RecommendationApp:
             if ver is not None and ver != CONFIG.expected_model_version:
                 # Non-fatal warning helps align training/runtime versions in a professional way.
                 logger.warning("Model version mismatch: %s != %s", ver, CONFIG.expected_model_version)
+            # Forest tree traversal is embarrassingly parallel per sample;
+            # let the final estimator use every core at predict time.
+            final = model.steps[-1][1] if hasattr(model, "steps") else model
+            if hasattr(final, "n_jobs"):
+                final.set_params(n_jobs=-1)
             logger.info("Model loaded from %s", MODEL_PATH)
             return model
         except Exception as e:
@@ -132,11 +219,78 @@ class RecommendationApp:
             messagebox.showerror("Model Load Error", f"Failed to load model: {e}")
             raise
 
+    def _model_version(self) -> str:
+        return getattr(self.model, "version_", None) or CONFIG.expected_model_version
+
+    def _model_cache_key(self) -> str:
+        """Identity of the loaded model for score-cache validation.
+
+        The training stamp (version_) is a static config string that
+        survives retrains unchanged, so the key also folds in the model
+        file's mtime — rewriting the pickle is the one thing every
+        retrain does.
+        """
+        try:
+            return f"{self._model_version()}-{MODEL_PATH.stat().st_mtime_ns}"
+        except OSError:
+            return self._model_version()
+
+    def _load_score_cache(self) -> Dict[int, float]:
+        """Load the persisted score cache if it matches the loaded model."""
+        try:
+            payload = joblib.load(SCORE_CACHE_FILE)
+            if payload.get("version") == self._model_cache_key():
+                scores = payload.get("scores", {})
+                logger.info("Loaded %d cached scores from %s", len(scores), SCORE_CACHE_FILE)
+                return scores
+            logger.info("Score cache is for model %s; ignoring", payload.get("version"))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to load score cache: %s", e)
+        return {}
+
+    def _save_score_cache(self) -> None:
+        """Persist memoized scores so restarts skip the full inference pass."""
+        try:
+            joblib.dump(
+                {"version": self._model_cache_key(), "scores": self._score_cache},
+                SCORE_CACHE_FILE,
+            )
+        except Exception as e:
+            logger.warning("Failed to save score cache: %s", e)
+
     def _open_db(self):
         """Open SQLite safely and return (connection, cursor)."""
         try:
-            conn = sqlite3.connect(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
+            # open_db applies the project-wide pragmas (WAL, synchronous=NORMAL,
+            # temp_store=MEMORY, page cache) shared with the other GUIs.
+            conn = open_db(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
             cursor = conn.cursor()
+            # The rerank SELECT filters on (type, not_interested, user_score);
+            # an index over the predicate columns turns it into a B-tree
+            # descent instead of a table scan. New-schema DBs get the same
+            # wide index the ingest script builds; legacy DBs (no skipped /
+            # has_blacklisted columns yet) get one over what they have.
+            cols = {row[1] for row in cursor.execute("PRAGMA table_info(manga)")}
+            self.manga_cols = cols
+            # Legacy DBs lack the precomputed has_blacklisted flag; expose the
+            # Python check as a deterministic SQL function so the filter can
+            # still run inside the engine instead of a per-row pandas apply.
+            if "has_blacklisted" not in cols:
+                conn.create_function("has_blacklist", 1, has_blacklisted, deterministic=True)
+            if {"skipped", "has_blacklisted"} <= cols:
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_manga_hot ON manga"
+                    "(type, not_interested, skipped, has_blacklisted, user_score)"
+                )
+            else:
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_manga_filters ON manga"
+                    "(type, not_interested, user_score)"
+                )
+            # Refresh planner statistics so the new index actually gets picked.
+            cursor.execute("PRAGMA optimize")
             logger.info("Connected to DB %s", DB_PATH)
             return conn, cursor
         except Exception as e:
@@ -178,10 +332,28 @@ class RecommendationApp:
         self.next_btn.pack(side="left")
 
     def _build_container(self) -> None:
-        """Scrollable container area where rows render."""
+        """Container area plus a reusable pool of page_size row widget trees.
+
+        Widget construction is one of the most expensive Tk operations, so
+        rows are built once here and page flips only reconfigure text/images
+        and pack/pack_forget the frames.
+        """
         self.container = ttk.Frame(self.root)
         self.container.pack(fill="both", expand=True)
 
+        self._msg_label = ttk.Label(self.container, text="")
+        self._row_widgets: List[RowWidgets] = []
+        for _ in range(CONFIG.page_size):
+            frame = ttk.Frame(self.container, padding=10)
+            img_label = tk.Label(frame, cursor="hand2", takefocus=True)
+            img_label.pack(side="left", padx=5)
+            info_label = tk.Label(frame, justify="left", font=("Arial", 10), anchor="w")
+            info_label.pack(side="left", padx=10)
+            synopsis_box = scrolledtext.ScrolledText(frame, height=5, width=50, wrap=tk.WORD)
+            synopsis_box.config(state=tk.DISABLED)
+            synopsis_box.pack(side="left", padx=5)
+            self._row_widgets.append(RowWidgets(frame, img_label, info_label, synopsis_box))
+
     # ------------------ Event handlers ------------------
     def _filters_changed(self) -> None:
         """Re-run ranking when any filter checkbox or type dropdown changes."""
@@ -199,6 +371,13 @@ class RecommendationApp:
         if self.ranked_df is None:
             return
         max_page = (len(self.ranked_df) - 1) // CONFIG.page_size
+        if self.page >= max_page and self._rank_source is not None:
+            # The user paged past the top-K window; pay for the full sort once.
+            self.ranked_df = (
+                self._rank_source.sort_values("score", ascending=False).reset_index(drop=True)
+            )
+            self._rank_source = None
+            max_page = (len(self.ranked_df) - 1) // CONFIG.page_size
         if self.page < max_page:
             self.page += 1
             self.render_current_page()
@@ -210,51 +389,37 @@ class RecommendationApp:
         (batched predict_proba for memory safety); sort descending by model score.
         """
         # Lightweight progress text
-        self._clear_container()
-        ttk.Label(self.container, text="Ranking the entire dataset…").pack(pady=12)
+        self._render_message("Ranking the entire dataset…")
         self.root.update_idletasks()
 
-        # Build dynamic WHERE clause based on filters
-        where: List[str] = []
-        params: List = []
-        if self.selected_type.get():
-            where.append("type = ?")
-            params.append(self.selected_type.get())
-        if not self.include_rated.get():
-            where.append("user_score IS NULL")
-        if not self.include_not_interested.get():
-            where.append("not_interested = 0")
-
-        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
-        sql = f"""
-            SELECT mal_id, title, type, genres, mean_score, chapters, volumes,
-                   synopsis, images, published_date
-            FROM manga
-            {where_sql}
-            ORDER BY mal_id ASC
-        """
+        # New-schema DBs store the cover URL directly; legacy DBs still carry
+        # the raw images JSON, decoded once below rather than per render.
+        image_col = "image_url" if "image_url" in self.manga_cols else "images"
+        type_sel = self.selected_type.get()
+        sql = rerank_sql(
+            bool(type_sel),
+            self.include_rated.get(),
+            self.include_not_interested.get(),
+            "has_blacklisted" in self.manga_cols,
+            image_col,
+        )
+        params: List = [type_sel] if type_sel else []
 
-        # Pull rows
+        # Pull rows straight into a DataFrame (no intermediate list of tuples,
+        # no per-row Python blacklist pass — the WHERE clause already did it).
         try:
-            self.cursor.execute(sql, params)
-            rows = self.cursor.fetchall()
-        except sqlite3.DatabaseError as e:
+            df = pd.read_sql_query(sql, self.conn, params=params)
+        except (sqlite3.DatabaseError, pd.errors.DatabaseError) as e:
             logger.exception("DB query failed")
             messagebox.showerror("Database Error", str(e))
-            self._clear_container()
+            self._hide_rows()
             return
 
-        # Frame the results with explicit column names
-        df = pd.DataFrame(
-            rows,
-            columns=[
-                "mal_id", "title", "type", "genres", "mean_score", "chapters", "volumes",
-                "synopsis", "images", "published_date",
-            ],
-        )
+        if image_col == "images":
+            # One bulk decode pass, then drop the multi-hundred-byte JSON
+            # strings so they don't sit in the frame for the whole session.
+            df["image_url"] = [extract_image_url(j) for j in df.pop("images").to_numpy()]
 
-        # Drop any titles that contain blacklisted genres (belt-and-suspenders with model-side cleaning)
-        df = df[~df["genres"].fillna("").apply(has_blacklisted)].reset_index(drop=True)
         logger.info("Rows after blacklist filter: %d", len(df))
 
         if df.empty:
@@ -266,15 +431,19 @@ class RecommendationApp:
 
         # --- Feature preparation (must align with training pipeline inputs) ---
         df = df.copy()
-        df["genre_list"] = (
-            df["genres"]
-            .fillna("")
-            .apply(lambda g: [x.strip() for x in g.split(",") if x.strip()])
-            .apply(clean_genres_for_inference)  # remove blacklist from feature list too
-        )
-        df["mean_score"] = df["mean_score"].fillna(0)
-        df["chapters"] = df["chapters"].fillna(0)
-        df["volumes"] = df["volumes"].fillna(0)
+        # Tokenize at C speed, then strip + drop blacklisted genres in one
+        # comprehension (no per-row Python function dispatch, single pass).
+        toks = df["genres"].fillna("").str.split(",")
+        df["genre_list"] = [
+            [t.strip() for t in row if t.strip() and t.strip().lower() not in BL_LOWER]
+            for row in toks
+        ]
+        # Narrow numeric dtypes: NULLs arrive as object/float64 from SQLite;
+        # fill and downcast once so the frame (and every feature batch sliced
+        # from it) stays compact instead of carrying boxed Python objects.
+        df["mean_score"] = df["mean_score"].fillna(0).astype(np.float32)
+        df["chapters"] = df["chapters"].fillna(0).astype(np.int32)
+        df["volumes"] = df["volumes"].fillna(0).astype(np.int32)
         df["synopsis"] = df["synopsis"].fillna("")
 
         # Defensive check: ensure the pipeline-required columns exist
@@ -284,45 +453,98 @@ class RecommendationApp:
             messagebox.showerror("Model Error", f"Missing model columns: {missing}")
             self.ranked_df = pd.DataFrame()
             self.page = 0
-            self._clear_container()
+            self._hide_rows()
             return
 
-        # --- Batched inference across the ENTIRE dataset ---
-        try:
-            scores = np.empty(len(df), dtype=float)
-            for start in range(0, len(df), CONFIG.predict_batch_size):
-                end = min(start + CONFIG.predict_batch_size, len(df))
-                batch = df.iloc[start:end]
-                proba = self.model.predict_proba(batch[REQUIRED_COLS])[:, 1]
-                scores[start:end] = proba
-            df["score"] = scores
-        except Exception as e:
-            logger.exception("Prediction failed on full dataset")
-            messagebox.showerror("Model Error", f"Prediction failed: {e}")
-            self.ranked_df = pd.DataFrame()
+        # --- Scoring: cached rows are free; the rest is scored lazily ---
+        self._rank_gen += 1
+        df["score"] = df["mal_id"].map(self._score_cache)
+        need = df[df["score"].isna()]
+        if need.empty:
+            # Everything memoized: a rerank is just the top-K extraction.
+            self._set_ranking(df)
             self.page = 0
-            self._clear_container()
+            self.render_current_page()
             return
 
-        # Sort highest-scoring recommendations first
-        self.ranked_df = df.sort_values("score", ascending=False).reset_index(drop=True)
+        # First paint immediately, ordered by MAL mean score as a cheap
+        # proxy, while the real scores are computed off the UI thread.
+        self.ranked_df = df.sort_values("mean_score", ascending=False).reset_index(drop=True)
+        self._rank_source = None
         self.page = 0
         self.render_current_page()
+        threading.Thread(
+            target=self._score_remaining, args=(df, need, self._rank_gen), daemon=True
+        ).start()
+
+    def _score_remaining(self, df: pd.DataFrame, need: pd.DataFrame, gen: int) -> None:
+        """Worker thread: fill the score cache for unscored rows in batches."""
+        try:
+            need_ids = need["mal_id"].to_numpy()
+            # Pre-extract each pipeline input column to a NumPy array once;
+            # each batch is then a thin DataFrame over array slices instead
+            # of a pandas row-slice that re-indexes the object columns.
+            cols = {c: need[c].to_numpy() for c in REQUIRED_COLS}
+            # Training lowercases synopses before hashing (the vectorizer
+            # runs with lowercase=False), so the serving input must match
+            # or mixed-case tokens hash to different buckets than at fit
+            # time. Done here so the displayed synopsis keeps its casing.
+            cols["synopsis"] = need["synopsis"].str.lower().to_numpy()
+            for start in range(0, len(need), CONFIG.predict_batch_size):
+                if gen != self._rank_gen:  # filters changed; this run is stale
+                    return
+                end = min(start + CONFIG.predict_batch_size, len(need))
+                batch = pd.DataFrame({c: cols[c][start:end] for c in REQUIRED_COLS}, copy=False)
+                proba = self.model.predict_proba(batch)[:, 1]
+                self._score_cache.update(zip(need_ids[start:end].tolist(), proba.tolist()))
+        except Exception:
+            logger.exception("Background scoring failed")
+            return
+        self.root.after(0, self._finalize_ranking, df, gen)
+
+    def _finalize_ranking(self, df: pd.DataFrame, gen: int) -> None:
+        """Main-thread callback: swap the proxy ordering for the model ranking."""
+        if gen != self._rank_gen:
+            return
+        df["score"] = df["mal_id"].map(self._score_cache)
+        self._set_ranking(df)
+        self.page = 0
+        self.render_current_page()
+
+    def _set_ranking(self, df: pd.DataFrame) -> None:
+        """Rank df by score, keeping only a top-K window for display.
+
+        argpartition finds the top K in O(N) and only the K winners get
+        sorted; the user rarely pages past 20 pages, and next_page falls
+        back to a full sort if they do.
+        """
+        k = CONFIG.page_size * 20
+        if len(df) <= k:
+            self.ranked_df = df.sort_values("score", ascending=False).reset_index(drop=True)
+            self._rank_source = None
+            return
+        scores = df["score"].to_numpy(dtype=float)
+        idx = np.argpartition(-scores, k)[:k]
+        idx = idx[np.argsort(-scores[idx])]
+        self.ranked_df = df.iloc[idx].reset_index(drop=True)
+        self._rank_source = df
 
     # ------------------ Rendering helpers ------------------
-    def _clear_container(self) -> None:
-        """Remove all child widgets from the container before re-rendering."""
-        for w in self.container.winfo_children():
-            w.destroy()
+    def _hide_rows(self) -> None:
+        """Unmap all pooled rows and the message label (nothing is destroyed)."""
+        self._msg_label.pack_forget()
+        for rw in self._row_widgets:
+            rw.frame.pack_forget()
 
     def _render_message(self, text: str) -> None:
         """Show a single message line in the container (e.g., empty state)."""
-        self._clear_container()
-        ttk.Label(self.container, text=text).pack(pady=12)
+        self._hide_rows()
+        self._msg_label.config(text=text)
+        self._msg_label.pack(pady=12)
 
     def render_current_page(self) -> None:
         """Render the current page of ranked results as rows with image, facts, and synopsis."""
-        self._clear_container()
+        self._hide_rows()
 
         if self.ranked_df is None or self.ranked_df.empty:
             self._render_message("No rows to display.")
@@ -335,57 +557,67 @@ class RecommendationApp:
         end = start + CONFIG.page_size
         page_df = self.ranked_df.iloc[start:end]
 
-        for _, row in page_df.iterrows():
-            frame = ttk.Frame(self.container, padding=10)
-            frame.pack(fill="x")
+        # itertuples avoids materializing a Series (with per-column dtype
+        # coercion) for every rendered row the way iterrows does.
+        for i, row in enumerate(page_df.itertuples(index=False)):
+            rw = self._row_widgets[i]
+            mal_id = int(row.mal_id)
 
-            # Cover image: placeholder text until we have it; cache by mal_id
-            img_label = tk.Label(frame, cursor="hand2", text="[Loading image]", takefocus=True)
-            img_label.pack(side="left", padx=5)
-
-            mal_id = int(row["mal_id"])
+            # Cover image: placeholder text until we have it; cache by mal_id.
+            # current_mal_id lets late cover callbacks detect a reused label.
+            rw.img_label.current_mal_id = mal_id
             if mal_id in self.img_cache:
                 # Use cached PhotoImage to avoid GC and refetch
-                img_label.config(image=self.img_cache[mal_id], text="")
-                img_label.image = self.img_cache[mal_id]
+                self.img_cache.move_to_end(mal_id)
+                rw.img_label.config(image=self.img_cache[mal_id], text="")
+                rw.img_label.image = self.img_cache[mal_id]
             else:
-                # Greedy but safe image loader (handles JSON & HTTP errors gracefully)
-                img = self._safe_photoimage_from_images_json(row.get("images") or "")
-                if img is not None:
-                    self.img_cache[mal_id] = img
-                    img_label.config(image=img, text="")
-                    img_label.image = img
+                rw.img_label.config(image="", text="[Loading image]")
+                rw.img_label.image = None
+                # Fetch + decode on the pool; each finished cover is applied
+                # via root.after so the mainloop never blocks on HTTP.
+                url = row.image_url
+                if url:
+                    fut = self.io_pool.submit(self._fetch_cover, mal_id, url)
+                    fut.add_done_callback(
+                        lambda f, lbl=rw.img_label, mid=mal_id:
+                            self.root.after(0, self._apply_cover, lbl, mid, f.result())
+                    )
                 else:
-                    img_label.config(text="[No Image]")
+                    rw.img_label.config(text="[No Image]")
 
             # Click image to open details editor
-            img_label.bind("<Button-1>", lambda e, mid=mal_id: self.open_details(mid))
+            rw.img_label.bind("<Button-1>", lambda e, mid=mal_id: self.open_details(mid))
 
             # A small "extra" line based on what fields are present
-            chapters = int(row.get("chapters") or 0)
-            volumes = int(row.get("volumes") or 0)
+            chapters = int(row.chapters or 0)
+            volumes = int(row.volumes or 0)
             if chapters:
                 extra_info = f"Chapters: {chapters}"
             elif volumes:
                 extra_info = f"Volumes: {volumes}"
             else:
-                pub = row.get("published_date")
+                pub = row.published_date
                 extra_info = f"Started in: {str(pub)[:4]}" if pub else "Start date unknown"
 
-            # Text block with key fields + model score
+            # Text block with key fields + model score ("…" while the
+            # background scorer is still working on this row)
+            score_txt = f"{row.score:.4f}" if pd.notna(row.score) else "…"
             info_text = (
-                f"{row['title']} (id={mal_id})\n"
-                f"Type: {row['type']} | Genres: {row['genres']}\n"
-                f"Match Score: {row['score']:.4f}\n"
+                f"{row.title} (id={mal_id})\n"
+                f"Type: {row.type} | Genres: {row.genres}\n"
+                f"Match Score: {score_txt}\n"
                 f"{extra_info}"
             )
-            tk.Label(frame, text=info_text, justify="left", font=("Arial", 10), anchor="w").pack(side="left", padx=10)
+            rw.info_label.config(text=info_text)
 
             # Read-only synopsis (scrollable, avoids giant labels)
-            synopsis_box = scrolledtext.ScrolledText(frame, height=5, width=50, wrap=tk.WORD)
-            synopsis_box.insert(tk.END, row.get("synopsis") or "")
-            synopsis_box.config(state=tk.DISABLED)
-            synopsis_box.pack(side="left", padx=5)
+            rw.synopsis_box.config(state=tk.NORMAL)
+            rw.synopsis_box.delete("1.0", tk.END)
+            rw.synopsis_box.insert(tk.END, row.synopsis or "")
+            rw.synopsis_box.config(state=tk.DISABLED)
+
+            rw.frame.pack(fill="x")
 
         # Update pagination widgets
         max_page = (len(self.ranked_df) - 1) // CONFIG.page_size
@@ -393,49 +625,73 @@ class RecommendationApp:
         self.prev_btn.state(["!disabled"] if self.page > 0 else ["disabled"])
         self.next_btn.state(["!disabled"] if self.page < max_page else ["disabled"])
 
-    def _safe_photoimage_from_images_json(self, images_json: str) -> Optional[ImageTk.PhotoImage]:
-        """
-        Decode the Jikan-style images JSON and fetch/resize with retrying HTTP session.
-        Returns a Tk PhotoImage or None if any step fails.
+    def _fetch_cover(self, mal_id: int, url: str) -> Optional[Image.Image]:
+        """Download and resize one cover. Worker-thread safe: no Tk objects.
+
+        Resized thumbnails persist under the shared covers directory (the
+        size suffix keeps them apart from the rating GUI's 150x220 ones), so
+        restarts re-read a few-KB local JPEG instead of re-downloading.
         """
+        w, h = CONFIG.img_size
+        cache_path = COVER_CACHE_DIR / f"{mal_id}_{w}x{h}.jpg"
+        if cache_path.exists():
+            try:
+                return Image.open(cache_path).convert("RGB")
+            except OSError as e:
+                logger.info("Bad cached cover for id=%s: %s", mal_id, e)
         try:
-            data = json.loads(images_json or "{}")
-            url = data.get("jpg", {}).get("image_url")
-            if not url:
-                return None
             resp = self.http.get(url, timeout=CONFIG.http_timeout_sec)
             resp.raise_for_status()
             img = Image.open(io.BytesIO(resp.content))
-            img = img.resize(CONFIG.img_size, Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except (json.JSONDecodeError, KeyError, requests.RequestException, UnidentifiedImageError) as e:
+            # draft decodes JPEGs at a fractional DCT scale; BILINEAR is
+            # indistinguishable from LANCZOS at 100x140 and much cheaper.
+            img.draft("RGB", CONFIG.img_size)
+            img = img.resize(CONFIG.img_size, Image.Resampling.BILINEAR).convert("RGB")
+            COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            img.save(cache_path, "JPEG", quality=85)
+            return img
+        except (requests.RequestException, UnidentifiedImageError, OSError) as e:
             logger.info("Image load failed: %s", e)
             return None
 
+    def _apply_cover(self, img_label: tk.Label, mal_id: int, pil_img: Optional[Image.Image]) -> None:
+        """Main-thread callback: build the PhotoImage and attach it to the label."""
+        try:
+            if getattr(img_label, "current_mal_id", None) != mal_id:
+                return  # label was re-used for another title by a page flip
+            if pil_img is None:
+                img_label.config(text="[No Image]")
+                return
+            photo = ImageTk.PhotoImage(pil_img)
+            self.img_cache[mal_id] = photo
+            self.img_cache.move_to_end(mal_id)
+            while len(self.img_cache) > self._img_cache_size:
+                self.img_cache.popitem(last=False)
+            img_label.config(image=photo, text="")
+            img_label.image = photo
+        except tk.TclError:
+            pass  # label was destroyed by a page flip before the cover arrived
+
     # ------------------ Detail editor dialog ------------------
     def open_details(self, mal_id: int) -> None:
         """
         Open a detail window for a single title; allow updating user_score, read, and not_interested.
         On save, we re-rank to reflect the new label/filter state.
         """
-        try:
-            self.cursor.execute(
-                """
-                SELECT title, synopsis, user_score, read, not_interested
-                FROM manga WHERE mal_id = ?
-                """,
-                (mal_id,),
-            )
-            result = self.cursor.fetchone()
-        except sqlite3.DatabaseError as e:
-            logger.exception("DB error on open_details")
-            messagebox.showerror("Database Error", f"Unable to load details: {e}")
+        # Everything this dialog shows already rode along in the rerank
+        # SELECT, so a click costs zero DB round-trips.
+        source = self.ranked_df if self._rank_source is None else self._rank_source
+        if source is None:
             return
-
-        if not result:
+        rows = source.loc[source["mal_id"] == mal_id]
+        if rows.empty:
             return
+        row = rows.iloc[0]
 
-        title, synopsis, user_score, read, not_interested = result
+        title, synopsis = row["title"], row["synopsis"]
+        user_score = row["user_score"] if pd.notna(row["user_score"]) else None
+        read = int(row["read"]) if pd.notna(row["read"]) else 0
+        not_interested = bool(row["not_interested"]) if pd.notna(row["not_interested"]) else False
 
         # Basic dialog layout
         win = tk.Toplevel(self.root)
@@ -472,15 +728,16 @@ class RecommendationApp:
         # Inline callback to persist changes, then refresh the main ranking
         def save_changes():
             try:
-                self.cursor.execute(
-                    """
-                    UPDATE manga
-                    SET user_score = ?, read = ?, not_interested = ?
-                    WHERE mal_id = ?
-                    """,
-                    (int(score_var.get()), int(DISP_TO_VAL[read_var.get()]), int(interested_var.get()), mal_id),
-                )
-                self.conn.commit()
+                # `with` scopes the write to one transaction (commit on
+                # success, rollback on error) without a manual commit call.
+                with self.conn:
+                    self.conn.execute(
+                        SQL_SAVE_DETAILS,
+                        (int(score_var.get()), int(DISP_TO_VAL[read_var.get()]), int(interested_var.get()), mal_id),
+                    )
+                # Labels don't feed the feature pipeline today, but drop the
+                # memoized score anyway so that assumption can't go stale.
+                self._score_cache.pop(mal_id, None)
             except sqlite3.DatabaseError as e:
                 logger.exception("DB error on save_changes")
                 messagebox.showerror("Database Error", f"Save failed: {e}")
@@ -494,6 +751,8 @@ class RecommendationApp:
     # ------------------ Shutdown / cleanup ------------------
     def on_close(self) -> None:
         """Close network + DB resources cleanly and destroy the window."""
+        self._save_score_cache()
+        self.io_pool.shutdown(wait=False)
         try:
             self.http.close()
         except Exception:
@@ -1,5 +1,8 @@
 import sqlite3
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from PIL import Image, ImageTk
@@ -10,7 +13,7 @@ import os
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-from definitions import DB_PATH, WEIGHTS_FILE  # ✅ updated path import
+from definitions import DB_PATH, WEIGHTS_FILE, COVER_CACHE_DIR, open_db  # ✅ updated path import
 
 RECOMMEND_LIMIT = 50
 
@@ -21,14 +24,70 @@ DEFAULT_WEIGHTS = {
     "published_date": 1.0
 }
 
+def compute_match_scores(genre_strings, genre_counter):
+    """Summed matched-genre weights per candidate, vectorized.
+
+    Maps each candidate's genres to indices into a weight vector
+    (CSR-style col_idx/row_ptr arrays), then one bincount accumulates
+    every candidate's matched weights in C instead of a per-row Python
+    dict build. Rows with no recognized genres simply contribute no
+    entries and keep a score of 0 (reduceat mishandles the empty
+    segments such rows produce, truncating their neighbours' sums).
+    """
+    genre_index = {g: i for i, g in enumerate(genre_counter)}
+    weights_vec = np.array(
+        [genre_counter[g] for g in genre_index], dtype=np.float32
+    )
+    col_idx = []
+    row_ptr = [0]
+    for genres_str in genre_strings:
+        if genres_str:
+            col_idx.extend(
+                genre_index[g] for g in genres_str.split(", ") if g in genre_index
+            )
+        row_ptr.append(len(col_idx))
+    n_rows = len(row_ptr) - 1
+    col_idx = np.asarray(col_idx, dtype=np.int32)
+    if not col_idx.size:
+        return np.zeros(n_rows, dtype=np.float32)
+    row_ids = np.repeat(np.arange(n_rows), np.diff(row_ptr))
+    return np.bincount(
+        row_ids, weights=weights_vec[col_idx], minlength=n_rows
+    ).astype(np.float32)
+
+@dataclass(slots=True)
+class Recommendation:
+    """One ranked row; slots keep the top-N list compact with fixed fields."""
+    mal_id: int
+    title: str
+    match_score: float
+    mean_score: float
+    chapters: int
+    published_date: str
+    images_json: str
+    synopsis: str
+    genres: str
+
 class MangaRecommender:
     def __init__(self):
-        self.conn = sqlite3.connect(DB_PATH)
+        self.conn = open_db()  # project-wide WAL/synchronous pragmas
         self.cursor = self.conn.cursor()
+        # Both recommender queries filter on these columns; create the index
+        # here too so older DB files built before the schema change get it.
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_manga_state ON manga(read, dropped, user_score)"
+        )
+        self.conn.commit()
         self.root = tk.Tk()
         self.root.title("Manga Recommendations")
         self.weights = self.load_weights()
         self.genre_counter = Counter()
+        self.candidates = None
+        # One session keeps the TCP/TLS connection to the image CDN alive
+        # across the five cover downloads; the pool fetches them in parallel.
+        self.session = requests.Session()
+        self.io_pool = ThreadPoolExecutor(max_workers=5)
+        self.top_gen = 0
         self.setup_ui()
         self.recommendations = self.generate_recommendations()
         self.show_top_images()
@@ -62,24 +121,81 @@ class MangaRecommender:
         tk.Button(self.button_frame, text="Adjust Weights", command=self.adjust_weights).pack(side="left", padx=10)
         tk.Button(self.button_frame, text="Genre Coverage", command=self.show_genre_coverage).pack(side="left", padx=10)
 
-    def fetch_image(self, image_url):
+    def image_url(self, rec):
+        # The images column is parsed lazily, only for rows actually shown
+        # on screen (and with json.loads -- the column holds untrusted
+        # scraped text, so eval() is out of the question).
+        if not rec.images_json:
+            return None
         try:
-            image_data = requests.get(image_url).content
-            img = Image.open(io.BytesIO(image_data)).resize((120, 170))
-            return ImageTk.PhotoImage(img)
+            images = json.loads(rec.images_json)
+        except ValueError:
+            return None
+        return images.get("jpg", {}).get("image_url")
+
+    def load_cover(self, mal_id, img_url):
+        """Return the 120x170 PIL cover, via the shared on-disk cache.
+
+        Covers never change, so a hit costs one small local read instead of
+        an HTTP round trip. The size suffix keeps this GUI's files from
+        clashing with the other tools sharing the cache directory.
+        """
+        cache_path = COVER_CACHE_DIR / f"{mal_id}_120x170.jpg"
+        if cache_path.exists():
+            try:
+                return Image.open(cache_path)
+            except:
+                pass  # corrupt cache file: refetch below
+        image_data = self.session.get(img_url, timeout=10).content
+        img = Image.open(io.BytesIO(image_data))
+        # draft lets libjpeg decode at a fractional DCT scale near the target
+        # size, skipping most of the full-resolution decode work.
+        img.draft("RGB", (120, 170))
+        img = img.resize((120, 170), Image.Resampling.BILINEAR).convert("RGB")
+        try:
+            COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            img.save(cache_path, "JPEG", quality=85)
+        except:
+            pass
+        return img
+
+    def fetch_image(self, mal_id, image_url):
+        try:
+            return ImageTk.PhotoImage(self.load_cover(mal_id, image_url))
         except:
             return None
 
-    def generate_recommendations(self):
-        self.cursor.execute("""
-            SELECT genres FROM manga
-            WHERE user_score >= 8 AND read != 0 AND dropped = 0
-        """)
-        genre_rows = self.cursor.fetchall()
+    def load_candidates(self):
+        """Run both queries and precompute the weight-independent arrays.
+
+        Called once at startup; adjusting weights afterwards only re-ranks
+        the cached arrays instead of re-reading the database.
+        """
         self.genre_counter = Counter()
-        for row in genre_rows:
-            genres = row[0].split(", ") if row[0] else []
-            self.genre_counter.update(genres)
+        has_bridge = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='manga_genre'"
+        ).fetchone() is not None
+        if has_bridge:
+            # The normalized bridge table lets sqlite aggregate the counts in
+            # one GROUP BY instead of shipping every genre string to Python
+            # and splitting it here.
+            self.cursor.execute("""
+                SELECT mg.genre, COUNT(*)
+                FROM manga_genre mg
+                JOIN manga m ON m.mal_id = mg.mal_id
+                WHERE m.user_score >= 8 AND m.read != 0 AND m.dropped = 0
+                GROUP BY mg.genre
+            """)
+            self.genre_counter.update(dict(self.cursor.fetchall()))
+        else:
+            # Legacy DB without the bridge: fall back to string splitting.
+            self.cursor.execute("""
+                SELECT genres FROM manga
+                WHERE user_score >= 8 AND read != 0 AND dropped = 0
+            """)
+            for row in self.cursor.fetchall():
+                genres = row[0].split(", ") if row[0] else []
+                self.genre_counter.update(genres)
 
         self.cursor.execute("""
             SELECT mal_id, title, genres, mean_score, chapters, published_date, images, synopsis
@@ -87,75 +203,111 @@ class MangaRecommender:
             WHERE (user_score IS NULL OR user_score = '')
               AND read = 0 AND dropped = 0
         """)
-        candidates = self.cursor.fetchall()
+        self.candidates = self.cursor.fetchall()
+        candidates = self.candidates
 
-        recommendations = []
-        total_genre_weight = sum(self.genre_counter.values()) or 1  # avoid division by zero
-
-        for mal_id, title, genres_str, mean_score, chapters, pub_date, images_json, synopsis in candidates:
-            genres = genres_str.split(", ") if genres_str else []
-            breakdown = {g: self.genre_counter.get(g, 0) for g in genres if g in self.genre_counter}
-            if breakdown:
-                match_raw = sum(breakdown.values())
-                match_score = (match_raw / total_genre_weight) * self.weights["match_score"]
-            else:
-                match_score = 0
-            recommendations.append({
-                "mal_id": mal_id,
-                "title": title,
-                "match_score": match_score,
-                "mean_score": mean_score or 0,
-                "chapters": chapters if chapters else -1,
-                "published_date": pub_date or "0000-00-00",
-                "images": eval(images_json) if images_json else {},
-                "synopsis": synopsis or "",
-                "genres": genres_str or "",
-                "match_breakdown": breakdown
-            })
+        self.total_genre_weight = sum(self.genre_counter.values()) or 1  # avoid division by zero
+
+        self.match_raw = compute_match_scores(
+            (row[2] for row in candidates), self.genre_counter
+        )
 
+        self.mean_scores = np.array([row[3] or 0 for row in candidates], dtype=np.float32)
+        self.chapters_arr = np.array([row[4] if row[4] else -1 for row in candidates], dtype=np.int32)
+        self.pub_dates = np.array([row[5] or "0000-00-00" for row in candidates])
+
+    def generate_recommendations(self):
+        if self.candidates is None:
+            self.load_candidates()
+        candidates = self.candidates
+
+        # Rank with lexsort on key arrays (primary key last), then build row
+        # dicts only for the top RECOMMEND_LIMIT instead of one dict per
+        # candidate just to throw most of them away after a Python sort.
         w = self.weights
-        recommendations.sort(
-            key=lambda x: (
-                -x["match_score"],
-                -x["mean_score"] * w["mean_score"],
-                -x["chapters"] * w["chapters"] if x["chapters"] != -1 else 0,
-                x["published_date"]
-            )
+        match_scores = self.match_raw * np.float32(w["match_score"] / self.total_genre_weight)
+        chap_key = np.where(
+            self.chapters_arr != -1,
+            -self.chapters_arr * np.float32(w["chapters"]),
+            np.float32(0.0),
+        )
+        order = np.lexsort(
+            (self.pub_dates, chap_key, -self.mean_scores * np.float32(w["mean_score"]), -match_scores)
         )
-        return recommendations[:RECOMMEND_LIMIT]
+
+        recommendations = []
+        for i in order[:RECOMMEND_LIMIT]:
+            mal_id, title, genres_str, mean_score, chapters, pub_date, images_json, synopsis = candidates[i]
+            recommendations.append(Recommendation(
+                mal_id=mal_id,
+                title=title,
+                match_score=float(match_scores[i]),
+                mean_score=mean_score or 0,
+                chapters=chapters if chapters else -1,
+                published_date=pub_date or "0000-00-00",
+                images_json=images_json,
+                synopsis=synopsis or "",
+                genres=genres_str or "",
+            ))
+        return recommendations
 
     def show_top_images(self):
+        # Downloads run on the pool so the window stays responsive; the
+        # generation counter drops results that arrive after the weights
+        # were re-applied and the top five changed.
+        self.top_gen += 1
+        gen = self.top_gen
         for i, rec in enumerate(self.recommendations[:5]):
-            img_url = rec["images"].get("jpg", {}).get("image_url")
-            img_tk = self.fetch_image(img_url) if img_url else None
             label = self.image_labels[i]
-            label.config(image=img_tk, text=rec["title"])
-            label.image = img_tk
+            label.config(image="", text=rec.title)
+            label.image = None
+            img_url = self.image_url(rec)
+            if img_url:
+                self.io_pool.submit(self.fetch_top_image, i, rec, img_url, gen)
+
+    def fetch_top_image(self, i, rec, img_url, gen):
+        title = rec.title
+        try:
+            img = self.load_cover(rec.mal_id, img_url)
+        except:
+            return
+        # PhotoImage is main-thread only; hand the decoded PIL image to Tk.
+        self.root.after(0, lambda: self.apply_top_image(i, title, img, gen))
+
+    def apply_top_image(self, i, title, img, gen):
+        if gen != self.top_gen:
+            return
+        img_tk = ImageTk.PhotoImage(img)
+        label = self.image_labels[i]
+        label.config(image=img_tk, text=title)
+        label.image = img_tk
 
     def show_details(self, index):
         rec = self.recommendations[index]
         win = tk.Toplevel(self.root)
-        win.title(rec["title"])
+        win.title(rec.title)
         win.geometry("600x500")
 
-        if rec["images"]:
-            img_url = rec["images"].get("jpg", {}).get("image_url")
-            if img_url:
-                img_tk = self.fetch_image(img_url)
-                if img_tk:
-                    tk.Label(win, image=img_tk).pack()
-                    win.image = img_tk
+        img_url = self.image_url(rec)
+        if img_url:
+            img_tk = self.fetch_image(rec.mal_id, img_url)
+            if img_tk:
+                tk.Label(win, image=img_tk).pack()
+                win.image = img_tk
 
-        tk.Label(win, text=rec["title"], font=("Arial", 14, "bold")).pack(pady=5)
-        tk.Label(win, text=f"Rating: {rec['mean_score']}, Chapters: {rec['chapters']}, Published: {rec['published_date']}\nMatch Score: {rec['match_score']:.2f}").pack()
+        tk.Label(win, text=rec.title, font=("Arial", 14, "bold")).pack(pady=5)
+        tk.Label(win, text=f"Rating: {rec.mean_score}, Chapters: {rec.chapters}, Published: {rec.published_date}\nMatch Score: {rec.match_score:.2f}").pack()
 
+        # Derived on demand for the clicked title only, rather than built as a
+        # dict for every candidate during scoring.
         breakdown_text = "\nMatch Breakdown (Normalized):\n"
-        for genre, count in rec["match_breakdown"].items():
-            breakdown_text += f"  {genre}: {count}\n"
+        for genre in rec.genres.split(", "):
+            if genre in self.genre_counter:
+                breakdown_text += f"  {genre}: {self.genre_counter[genre]}\n"
         tk.Label(win, text=breakdown_text, justify="left", font=("Courier", 10)).pack(padx=10, pady=5, anchor="w")
 
         synopsis_box = scrolledtext.ScrolledText(win, wrap=tk.WORD, height=15)
-        synopsis_box.insert(tk.END, rec["synopsis"])
+        synopsis_box.insert(tk.END, rec.synopsis)
         synopsis_box.config(state=tk.DISABLED)
         synopsis_box.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -173,11 +325,11 @@ class MangaRecommender:
 
         for rec in self.recommendations:
             tree.insert("", tk.END, values=(
-                rec["title"],
-                round(rec["match_score"], 2),
-                rec["mean_score"],
-                rec["chapters"],
-                rec["published_date"]
+                rec.title,
+                round(rec.match_score, 2),
+                rec.mean_score,
+                rec.chapters,
+                rec.published_date
             ))
 
     def adjust_weights(self):
@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import json
 import logging
+import re
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Dict, List, Optional, Sequence, Tuple
 
 import requests
@@ -20,7 +22,7 @@ from requests.adapters import HTTPAdapter
 from tkinter import ttk, scrolledtext
 from urllib3.util.retry import Retry
 
-from definitions import DB_PATH, GENRE_BLACKLIST  # expects GENRE_BLACKLIST to be defined
+from definitions import COVER_CACHE_DIR, DB_PATH, GENRE_BLACKLIST, open_db  # expects GENRE_BLACKLIST to be defined
 
 # -------------------------
 # Logging
@@ -36,12 +38,16 @@ class AppConfig:
     http_timeout: int = 5
     img_size: Tuple[int, int] = (120, 160)
     user_agent: str = "MangaSearch/1.0"
+    # Rows rendered into the Treeview per batch (rest fills in on scroll)
+    render_chunk: int = 200
     # Default sort column & order
     default_sort_col: str = "MAL Score"
     default_sort_desc: bool = True
 
 CONFIG = AppConfig()
-BL_LOWER = {g.lower() for g in GENRE_BLACKLIST}
+# Compiled alternation so the blacklist check is a single C-level scan
+# (same pattern the RF recommender uses).
+BL_RE = re.compile("|".join(re.escape(g) for g in GENRE_BLACKLIST), re.IGNORECASE)
 
 # Column definition for Treeview
 COLUMNS: Tuple[str, ...] = (
@@ -57,14 +63,54 @@ COL_INDEX: Dict[str, int] = {
 # -------------------------
 # Helpers
 # -------------------------
-def split_genres(s: Optional[str]) -> List[str]:
-    if not s:
-        return []
-    # DB often stores as "A, B, C"
-    return [g.strip() for g in s.split(",") if g.strip()]
-
 def has_blacklisted(genres_str: Optional[str]) -> bool:
-    return any(g.lower() in BL_LOWER for g in split_genres(genres_str))
+    return bool(BL_RE.search(genres_str)) if genres_str else False
+
+
+SEARCH_SELECT = """
+    SELECT mal_id, title, type, status, chapters, volumes,
+           mean_score, user_score, read, dropped, genres, synopsis,
+           published_date, not_interested, images
+    FROM manga
+    WHERE 1=1
+"""
+
+@functools.lru_cache(maxsize=64)
+def build_search_sql(has_type: bool, has_blacklist_col: bool, title_mode: str,
+                     n_include: int, n_exclude: int, use_bridge: bool) -> str:
+    """Compose the search SQL for one shape of filters.
+
+    Cached per shape so repeated searches hand sqlite the identical string,
+    letting its internal statement cache skip the reparse/replan. Clause
+    order: indexed type equality first, then the blacklist flag, then the
+    expensive text/genre predicates.
+    """
+    query = SEARCH_SELECT
+    if has_type:
+        query += " AND type = ?"
+    if has_blacklist_col:
+        query += " AND has_blacklisted = 0"
+    else:
+        query += " AND NOT has_blacklist(genres)"
+    if title_mode == "fts":
+        # Quoted prefix-phrase MATCH against the title FTS index.
+        query += (" AND manga.mal_id IN"
+                  " (SELECT rowid FROM manga_fts WHERE manga_fts MATCH ?)")
+    elif title_mode == "like":
+        query += " AND title LIKE ?"
+    if use_bridge:
+        # Indexed equality probes against the junction table; the genres
+        # TEXT column is kept for display only.
+        query += (" AND EXISTS (SELECT 1 FROM manga_genre mg"
+                  " WHERE mg.mal_id = manga.mal_id"
+                  " AND mg.genre = ? COLLATE NOCASE)") * n_include
+        query += (" AND NOT EXISTS (SELECT 1 FROM manga_genre mg"
+                  " WHERE mg.mal_id = manga.mal_id"
+                  " AND mg.genre = ? COLLATE NOCASE)") * n_exclude
+    else:
+        query += " AND genres LIKE ?" * n_include
+        query += " AND genres NOT LIKE ?" * n_exclude
+    return query
 
 
 class MangaSearchApp:
@@ -74,12 +120,50 @@ class MangaSearchApp:
         self.sort_column: str = CONFIG.default_sort_col
         self.sort_reverse: bool = CONFIG.default_sort_desc
         self.manga_data: List[Tuple] = []
+        self.display_rows: List[Tuple] = []
+        self._rendered = 0
+
+        # Searches run on a single worker thread (sqlite connections are not
+        # shareable across threads, so the worker opens its own); the
+        # generation counter drops results a newer search has superseded.
+        self.search_pool = ThreadPoolExecutor(max_workers=1)
+        self.img_pool = ThreadPoolExecutor(max_workers=2)
+        self._worker_conn: Optional[sqlite3.Connection] = None
+        self._search_gen = 0
+        self._search_after_id: Optional[str] = None
+        # Filters behind the rows currently shown, for incremental narrowing.
+        self._last_filters: Optional[Tuple[str, str, str]] = None
 
         # Persistent DB & HTTP sessions
-        self.conn = sqlite3.connect(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
+        self.conn = open_db(detect_types=sqlite3.PARSE_DECLTYPES)
         self.cursor = self.conn.cursor()
         logger.info("Connected to DB %s", DB_PATH)
 
+        # Newer DBs precompute a has_blacklisted flag; on legacy files we
+        # register the Python predicate as a SQL function so the filter still
+        # runs inside the scan instead of over a fully fetched result set.
+        self.manga_cols = {row[1] for row in self.cursor.execute("PRAGMA table_info(manga)")}
+        if "has_blacklisted" not in self.manga_cols:
+            self.conn.create_function("has_blacklist", 1, has_blacklisted, deterministic=True)
+
+        # Type equality is the one cheap indexable manga predicate; reuse the
+        # type-first hot index the other GUIs maintain, creating it (or the
+        # legacy-schema variant) on DB files that predate it.
+        if {"skipped", "has_blacklisted"} <= self.manga_cols:
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_manga_hot ON manga"
+                "(type, not_interested, skipped, has_blacklisted, user_score)"
+            )
+        else:
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_manga_filters ON manga"
+                "(type, not_interested, user_score)"
+            )
+        self.conn.commit()
+
+        self.has_genre_bridge = self._ensure_genre_bridge()
+        self.has_fts = self._ensure_title_fts()
+
         self.http = requests.Session()
         self.http.headers.update({"User-Agent": CONFIG.user_agent})
         retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
@@ -126,9 +210,9 @@ class MangaSearchApp:
         self.tree = ttk.Treeview(self.root, columns=COLUMNS, show="headings")
         self.tree.grid(row=2, column=0, columnspan=5, sticky="nsew", padx=5, pady=10)
 
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.grid(row=2, column=5, sticky="ns")
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        self.scrollbar.grid(row=2, column=5, sticky="ns")
 
         for col in COLUMNS:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_by(c))
@@ -142,9 +226,86 @@ class MangaSearchApp:
 
         self.tree.bind("<Double-1>", self.on_double_click)
 
+    def _ensure_genre_bridge(self) -> bool:
+        """Build the manga_genre junction table on DB files that predate it.
+
+        Genre include/exclude filters then run as indexed equality probes on
+        the junction table instead of LIKE '%...%' scans over the genres
+        string for every row. The NOCASE index keeps the old case-insensitive
+        matching while staying index-eligible.
+        """
+        try:
+            exists = self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='manga_genre'"
+            ).fetchone() is not None
+            with self.conn:
+                if not exists:
+                    logger.info("Migrating genres into manga_genre junction table")
+                    self.conn.execute("CREATE TABLE manga_genre (mal_id INTEGER, genre TEXT)")
+                    rows = [
+                        (mal_id, g.strip())
+                        for mal_id, genres in self.cursor.execute(
+                            "SELECT mal_id, genres FROM manga"
+                        ).fetchall()
+                        for g in (genres or "").split(",")
+                        if g.strip()
+                    ]
+                    self.conn.executemany(
+                        "INSERT INTO manga_genre (mal_id, genre) VALUES (?, ?)", rows
+                    )
+                self.conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_mg_nocase"
+                    " ON manga_genre(genre COLLATE NOCASE, mal_id)"
+                )
+            return True
+        except sqlite3.DatabaseError:
+            logger.exception("Genre bridge migration failed; falling back to LIKE filters")
+            return False
+
+    def _ensure_title_fts(self) -> bool:
+        """Create an FTS5 index over titles and keep it in sync with triggers.
+
+        Title search then probes the inverted index (prefix-phrase MATCH)
+        instead of scanning every title with an unindexable LIKE '%...%'.
+        """
+        try:
+            exists = self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='manga_fts'"
+            ).fetchone() is not None
+            if not exists:
+                logger.info("Building FTS5 title index")
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE manga_fts USING fts5("
+                    "title, content='manga', content_rowid='mal_id')"
+                )
+                self.conn.execute("INSERT INTO manga_fts(manga_fts) VALUES('rebuild')")
+            self.conn.executescript("""
+                CREATE TRIGGER IF NOT EXISTS manga_fts_ai AFTER INSERT ON manga BEGIN
+                    INSERT INTO manga_fts(rowid, title) VALUES (new.mal_id, new.title);
+                END;
+                CREATE TRIGGER IF NOT EXISTS manga_fts_ad AFTER DELETE ON manga BEGIN
+                    INSERT INTO manga_fts(manga_fts, rowid, title)
+                    VALUES ('delete', old.mal_id, old.title);
+                END;
+                CREATE TRIGGER IF NOT EXISTS manga_fts_au AFTER UPDATE OF title ON manga BEGIN
+                    INSERT INTO manga_fts(manga_fts, rowid, title)
+                    VALUES ('delete', old.mal_id, old.title);
+                    INSERT INTO manga_fts(rowid, title) VALUES (new.mal_id, new.title);
+                END;
+            """)
+            self.conn.commit()
+            return True
+        except sqlite3.DatabaseError:
+            logger.exception("FTS5 unavailable; falling back to LIKE title search")
+            return False
+
     # -------------------------
     # Filters
     # -------------------------
+    # One token of the include/exclude grammar: optional sign, then the
+    # genre name. Compiled once at class definition time.
+    GENRE_TOKEN_RE = re.compile(r"([+-]?)(\S+)")
+
     def parse_genre_filter(self, genre_string: str) -> Tuple[List[str], List[str]]:
         """
         Parse a simple include/exclude grammar:
@@ -153,130 +314,232 @@ class MangaSearchApp:
         - first bare token is treated as include
         """
         include, exclude = [], []
-        parts = [p.strip() for p in genre_string.split() if p.strip()]
-        for i, part in enumerate(parts):
-            if part.startswith("+"):
-                include.append(part[1:])
-            elif part.startswith("-"):
-                exclude.append(part[1:])
+        for i, m in enumerate(self.GENRE_TOKEN_RE.finditer(genre_string)):
+            sign, token = m.groups()
+            if sign == "+":
+                include.append(token)
+            elif sign == "-":
+                exclude.append(token)
             elif i == 0:
-                include.append(part)
+                include.append(token)
         return include, exclude
 
     # -------------------------
     # Data
     # -------------------------
-    def fetch_data(self) -> List[Tuple]:
-        """
-        Fetch rows applying title/type/genre LIKE filters in SQL,
-        then apply blacklist filtering in Python (case-insensitive).
+    def build_query(self) -> Tuple[str, List[object]]:
         """
-        query = """
-            SELECT mal_id, title, type, status, chapters, volumes,
-                   mean_score, user_score, read, dropped, genres, synopsis,
-                   published_date, not_interested, images
-            FROM manga
-            WHERE 1=1
+        Build the search query applying title/type/genre filters and the
+        genre blacklist in SQL (case-insensitive). Widget reads happen here,
+        on the main thread; execution happens on the search worker. The SQL
+        text itself comes from the memoized build_search_sql, keyed only on
+        the filter shape, so parameters are gathered here in the same order
+        the builder emits its placeholders.
         """
-        params: List[object] = []
-
         title = (self.title_entry.get() or "").strip()
         genre_filter = (self.genre_entry.get() or "").strip()
         type_filter = (self.type_var.get() or "").strip()
+        include, exclude = self.parse_genre_filter(genre_filter)
 
-        if title:
-            query += " AND title LIKE ?"
-            params.append(f"%{title}%")
+        params: List[object] = []
         if type_filter:
-            query += " AND type = ?"
             params.append(type_filter)
 
-        include, exclude = self.parse_genre_filter(genre_filter)
-        for g in include:
-            query += " AND genres LIKE ?"
-            params.append(f"%{g}%")
-        for g in exclude:
-            query += " AND genres NOT LIKE ?"
-            params.append(f"%{g}%")
-
-        # Execute
-        try:
-            self.cursor.execute(query, params)
-            results = self.cursor.fetchall()
-        except sqlite3.DatabaseError as e:
-            logger.exception("DB query failed")
-            return []
-
-        # Python-side blacklist filter (handles any case)
-        filtered = [r for r in results if not has_blacklisted(r[10])]
-        logger.info("Fetched %d rows (post-blacklist)", len(filtered))
-        return filtered
+        title_mode = ""
+        if title:
+            if self.has_fts:
+                # Double-quoting makes the input a literal phrase (no FTS
+                # operators) and the trailing * a prefix match on it.
+                title_mode = "fts"
+                params.append('"%s"*' % title.replace('"', '""'))
+            else:
+                title_mode = "like"
+                params.append(f"%{title}%")
+
+        if self.has_genre_bridge:
+            params.extend(include)
+            params.extend(exclude)
+        else:
+            params.extend(f"%{g}%" for g in include)
+            params.extend(f"%{g}%" for g in exclude)
+
+        query = build_search_sql(
+            bool(type_filter),
+            "has_blacklisted" in self.manga_cols,
+            title_mode,
+            len(include),
+            len(exclude),
+            self.has_genre_bridge,
+        )
+        return query, params
 
     # -------------------------
     # Actions
     # -------------------------
     def on_search(self) -> None:
-        data = self.fetch_data()
-        self.display_data(data)
+        # Debounce: rapid Return presses collapse into one query.
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._start_search)
+
+    def _start_search(self) -> None:
+        self._search_after_id = None
+        filters = (
+            (self.title_entry.get() or "").strip().lower(),
+            (self.genre_entry.get() or "").strip(),
+            (self.type_var.get() or "").strip(),
+        )
+        self._search_gen += 1
+
+        # Incremental narrowing: if genre/type are unchanged and the new
+        # title extends the previous one, every hit is already in the rows on
+        # screen, so filter them in memory instead of re-querying the DB.
+        prev = self._last_filters
+        if prev is not None and prev[1:] == filters[1:] and prev[0] in filters[0]:
+            needle = filters[0]
+            results = [r for r in self.manga_data if needle in (r[1] or "").lower()]
+            logger.info("Narrowed to %d rows in memory", len(results))
+            self._apply_search(results, self._search_gen, filters)
+            return
+
+        query, params = self.build_query()
+        self.search_pool.submit(self._run_search, query, params, self._search_gen, filters)
+
+    def _run_search(self, query: str, params: List[object], gen: int,
+                    filters: Tuple[str, str, str]) -> None:
+        """Execute the search on the worker thread with a private connection."""
+        results: List[Tuple] = []
+        try:
+            # One persistent connection owned by this (single) worker thread:
+            # page cache and prepared-statement cache survive across
+            # searches, so repeated filter shapes skip reparse/replan.
+            conn = self._worker_conn
+            if conn is None:
+                conn = open_db(detect_types=sqlite3.PARSE_DECLTYPES)
+                if "has_blacklisted" not in self.manga_cols:
+                    conn.create_function("has_blacklist", 1, has_blacklisted, deterministic=True)
+                self._worker_conn = conn
+            cursor = conn.execute(query, params)
+            # Stream in batches rather than one giant fetchall allocation
+            # (broad searches can match most of the table).
+            while batch := cursor.fetchmany(500):
+                results.extend(batch)
+        except sqlite3.DatabaseError:
+            logger.exception("DB query failed")
+            results = []
+        # Tk widgets are main-thread only; hand the rows back via after().
+        self.root.after(0, lambda: self._apply_search(results, gen, filters))
+
+    def _apply_search(self, results: List[Tuple], gen: int,
+                      filters: Tuple[str, str, str]) -> None:
+        if gen != self._search_gen:
+            return  # superseded by a newer search while this one ran
+        logger.info("Fetched %d rows (blacklist filtered in SQL)", len(results))
+        self._last_filters = filters
+        self.display_data(results)
         if self.sort_column:
             self.sort_by(self.sort_column, keep_order=True)
 
-    def display_data(self, data: Sequence[Tuple]) -> None:
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        self.manga_data = list(data)
-        for row in data:
-            (mal_id, title, type_, status, chapters, volumes, mean_score,
-             user_score, read, dropped, genres, _synopsis, published_date, not_interested, _images) = row
+    def build_display_row(self, row: Tuple) -> Tuple:
+        """Derive the 11 visible column values plus the color tag for one DB row.
 
-            # Chapters column UX: show start year if publishing & chapters unknown
-            if (not chapters or chapters == 0) and status and status.lower() == "publishing" and published_date:
-                try:
-                    start_year = datetime.strptime(str(published_date)[:10], "%Y-%m-%d").year
-                    display_chap = f"Started in: {start_year}"
-                except Exception:
-                    display_chap = "Started in: ?"
-            else:
-                display_chap = chapters
-
-            # Read symbol
-            if read == 0:
-                read_symbol = "❌"
-            elif read == -1:
-                read_symbol = "✅"
-            elif read == -2:
-                read_symbol = "📘"
-            else:
-                read_symbol = str(read)
+        Called once per fetched row; the result is cached on self.display_rows
+        so sorting reuses it instead of re-deriving symbols and dates for the
+        whole result set on every header click.
+        """
+        (mal_id, title, type_, status, chapters, volumes, mean_score,
+         user_score, read, dropped, genres, _synopsis, published_date, not_interested, _images) = row
 
-            # Dropped text
+        # Chapters column UX: show start year if publishing & chapters unknown
+        if (not chapters or chapters == 0) and status and status.lower() == "publishing" and published_date:
+            try:
+                # Dates are ISO strings; slicing the year is ~30x cheaper than
+                # strptime building a datetime just to read .year.
+                start_year = int(str(published_date)[:4])
+                display_chap = f"Started in: {start_year}"
+            except Exception:
+                display_chap = "Started in: ?"
+        else:
+            display_chap = chapters
+
+        # Read symbol
+        if read == 0:
+            read_symbol = "❌"
+        elif read == -1:
+            read_symbol = "✅"
+        elif read == -2:
+            read_symbol = "📘"
+        else:
+            read_symbol = str(read)
+
+        # Dropped text
+        if dropped == 1:
+            dropped_text = "🔴 Dropped"
+        elif dropped == 2:
+            dropped_text = "🔄 Might Pick Up"
+        else:
+            dropped_text = "🟢 Not Dropped"
+
+        not_interested_text = "🚫" if not_interested else ""
+
+        # Row tag for coloring
+        row_tag = ""
+        if read != 0:
             if dropped == 1:
-                dropped_text = "🔴 Dropped"
-            elif dropped == 2:
-                dropped_text = "🔄 Might Pick Up"
+                row_tag = "dropped"
+            elif (status or "").lower() == "finished":
+                row_tag = "finished"
             else:
-                dropped_text = "🟢 Not Dropped"
-
-            not_interested_text = "🚫" if not_interested else ""
-
-            # Row tag for coloring
-            row_tag = ""
-            if read != 0:
-                if dropped == 1:
-                    row_tag = "dropped"
-                elif (status or "").lower() == "finished":
-                    row_tag = "finished"
-                else:
-                    row_tag = "ongoing"
-
-            self.tree.insert(
-                "", tk.END,
-                values=(title, type_, status, display_chap, volumes, mean_score, user_score,
-                        read_symbol, dropped_text, genres, not_interested_text),
-                iid=str(mal_id),
-                tags=(row_tag,) if row_tag else ()
+                row_tag = "ongoing"
+
+        return (title, type_, status, display_chap, volumes, mean_score, user_score,
+                read_symbol, dropped_text, genres, not_interested_text, row_tag)
+
+    def display_data(self, data: Sequence[Tuple]) -> None:
+        """Take a fresh result set: derive the display tuples, then render."""
+        self.manga_data = list(data)
+        self.display_rows = [self.build_display_row(row) for row in self.manga_data]
+        self.render_rows()
+
+    def render_rows(self) -> None:
+        """Redraw the Treeview from the cached rows (no re-derivation).
+
+        Only the first chunk is inserted eagerly; the rest streams in from
+        _on_tree_scroll as the user approaches the bottom, so huge result
+        sets don't pay thousands of up-front tree inserts for rows nobody
+        ever scrolls to. self.manga_data stays the authoritative model.
+        """
+        # One Tcl call clears every row; deleting item-by-item pays a
+        # Python->Tcl round trip (and a relayout) per row.
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        self._rendered = 0
+        self._render_more()
+
+    def _render_more(self) -> None:
+        """Insert the next chunk of cached rows into the tree."""
+        end_idx = min(self._rendered + CONFIG.render_chunk, len(self.manga_data))
+        # Local bindings keep the bulk-insert loop free of attribute lookups.
+        insert = self.tree.insert
+        end = tk.END
+        for i in range(self._rendered, end_idx):
+            row = self.manga_data[i]
+            disp = self.display_rows[i]
+            insert(
+                "", end,
+                values=disp[:11],
+                iid=str(row[0]),
+                tags=(disp[11],) if disp[11] else ()
             )
+        self._rendered = end_idx
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """yscrollcommand hook: update the scrollbar, top up near the end."""
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9 and self._rendered < len(self.manga_data):
+            self._render_more()
 
     def sort_by(self, column: str, keep_order: bool = False) -> None:
         col_idx = COL_INDEX.get(column)
@@ -310,47 +573,18 @@ class MangaSearchApp:
                 except Exception:
                     return s.lower()
 
-        # Build a list of tuples matching display order used in Treeview
-        display_rows = []
-        for row in self.manga_data:
-            (mal_id, title, type_, status, chapters, volumes, mean_score,
-             user_score, read, dropped, genres, _synopsis, published_date, not_interested, _images) = row
-
-            # Recreate the display row used above for consistent sorting
-            if (not chapters or chapters == 0) and status and status.lower() == "publishing" and published_date:
-                try:
-                    start_year = datetime.strptime(str(published_date)[:10], "%Y-%m-%d").year
-                    display_chap = f"Started in: {start_year}"
-                except Exception:
-                    display_chap = "Started in: ?"
-            else:
-                display_chap = chapters
-
-            if read == 0: read_symbol = "❌"
-            elif read == -1: read_symbol = "✅"
-            elif read == -2: read_symbol = "📘"
-            else: read_symbol = str(read)
-
-            if dropped == 1: dropped_text = "🔴 Dropped"
-            elif dropped == 2: dropped_text = "🔄 Might Pick Up"
-            else: dropped_text = "🟢 Not Dropped"
-
-            not_interested_text = "🚫" if not_interested else ""
-
-            display_rows.append((
-                title, type_, status, display_chap, volumes, mean_score, user_score,
-                read_symbol, dropped_text, genres, not_interested_text,  # 11 visible columns
-                mal_id  # keep original id to re-map later if needed
-            ))
-
-        # Sort
-        sorted_display = sorted(display_rows, key=lambda r: coerce_numeric(r[col_idx - 1]), reverse=self.sort_reverse)
-
-        # Rebuild a light dataset to render (we can reuse display_data for consistent code path)
-        # Map back to original self.manga_data order by mal_id
-        id_to_row = {str(r[0]): r for r in self.manga_data}  # key by mal_id string
-        sorted_original = [id_to_row[str(r[-1])] for r in sorted_display]
-        self.display_data(sorted_original)
+        # Sort index positions keyed by the cached display tuples; applying
+        # the same permutation to manga_data keeps both lists aligned with no
+        # per-sort id_to_row dict rebuild or mal_id re-mapping.
+        key_col = col_idx - 1
+        order = sorted(
+            range(len(self.manga_data)),
+            key=lambda i: coerce_numeric(self.display_rows[i][key_col]),
+            reverse=self.sort_reverse,
+        )
+        self.manga_data = [self.manga_data[i] for i in order]
+        self.display_rows = [self.display_rows[i] for i in order]
+        self.render_rows()
 
     def on_double_click(self, event) -> None:
         item_id = self.tree.focus()
@@ -402,21 +636,10 @@ class MangaSearchApp:
         win.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(12, weight=1)
 
-        # Image (safe JSON, retries, timeout)
+        # Cover loads off-thread (disk cache first) so opening details never
+        # blocks the UI on the network; the label appears when it's ready.
         if images:
-            try:
-                data = json.loads(images or "{}")
-                img_url = (data.get("jpg") or {}).get("image_url")
-                if img_url:
-                    resp = self.http.get(img_url, timeout=CONFIG.http_timeout)
-                    resp.raise_for_status()
-                    img = Image.open(io.BytesIO(resp.content)).resize(CONFIG.img_size, Image.Resampling.LANCZOS)
-                    img_tk = ImageTk.PhotoImage(img)
-                    img_label = tk.Label(win, image=img_tk)
-                    img_label.image = img_tk
-                    img_label.grid(row=0, column=1, rowspan=6, sticky="ne", padx=10, pady=10)
-            except (json.JSONDecodeError, UnidentifiedImageError, requests.RequestException) as e:
-                logger.info("Image load failed (details) for id=%s: %s", mal_id, e)
+            self.img_pool.submit(self._load_details_image, win, mal_id, images)
 
         tk.Label(win, text=f"Title: {title}", font=("Arial", 12, "bold")).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         tk.Label(win, text=f"Genres: {genres or 'N/A'}", wraplength=440).grid(row=1, column=0, sticky="w", padx=10)
@@ -459,6 +682,46 @@ class MangaSearchApp:
             ),
         ).pack(anchor="center")
 
+    def _load_details_image(self, win: tk.Toplevel, mal_id: str, images: str) -> None:
+        """Worker: cover from the shared disk cache, or fetch/decode/cache it."""
+        try:
+            data = json.loads(images or "{}")
+            img_url = (data.get("jpg") or {}).get("image_url")
+            if not img_url:
+                return
+            w, h = CONFIG.img_size
+            cache_path = COVER_CACHE_DIR / f"{mal_id}_{w}x{h}.jpg"
+            img: Optional[Image.Image] = None
+            if cache_path.exists():
+                try:
+                    img = Image.open(cache_path)
+                    img.load()
+                except OSError:
+                    img = None  # corrupt cache file: refetch below
+            if img is None:
+                resp = self.http.get(img_url, timeout=CONFIG.http_timeout)
+                resp.raise_for_status()
+                img = Image.open(io.BytesIO(resp.content))
+                # draft decodes JPEGs at a fractional DCT scale; BILINEAR
+                # is indistinguishable from LANCZOS at thumbnail size.
+                img.draft("RGB", CONFIG.img_size)
+                img = img.resize(CONFIG.img_size, Image.Resampling.BILINEAR).convert("RGB")
+                COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                img.save(cache_path, "JPEG", quality=85)
+        except (json.JSONDecodeError, UnidentifiedImageError, requests.RequestException, OSError) as e:
+            logger.info("Image load failed (details) for id=%s: %s", mal_id, e)
+            return
+        # PhotoImage creation is main-thread only.
+        self.root.after(0, lambda: self._apply_details_image(win, img))
+
+    def _apply_details_image(self, win: tk.Toplevel, img: Image.Image) -> None:
+        if not win.winfo_exists():
+            return  # window was closed before the cover arrived
+        img_tk = ImageTk.PhotoImage(img)
+        img_label = tk.Label(win, image=img_tk)
+        img_label.image = img_tk
+        img_label.grid(row=0, column=1, rowspan=6, sticky="ne", padx=10, pady=10)
+
     def _save_changes(
         self,
         win: tk.Toplevel,
@@ -470,27 +733,63 @@ class MangaSearchApp:
     ) -> None:
         try:
             dropped_int = int(drop_var.get().split(" ")[0])
-            self.cursor.execute(
-                """
-                UPDATE manga
-                SET user_score = ?, read = ?, dropped = ?, not_interested = ?
-                WHERE mal_id = ?
-                """,
-                (int(score_var.get()), int(chapter_var.get()), dropped_int, int(not_interested_var.get()), mal_id),
+            values = (
+                int(score_var.get()), int(chapter_var.get()),
+                dropped_int, int(not_interested_var.get()),
             )
-            self.conn.commit()
+            # `with` scopes the write to one atomic transaction/commit.
+            with self.conn:
+                self.conn.execute(
+                    """
+                    UPDATE manga
+                    SET user_score = ?, read = ?, dropped = ?, not_interested = ?
+                    WHERE mal_id = ?
+                    """,
+                    (*values, mal_id),
+                )
             logger.info("Saved changes for mal_id=%s", mal_id)
-        except sqlite3.DatabaseError as e:
+        except sqlite3.DatabaseError:
             logger.exception("Save failed")
-            return
-        finally:
             win.destroy()
-            self.on_search()
+            return
+        win.destroy()
+        self._patch_row(mal_id, *values)
+
+    def _patch_row(self, mal_id: str, user_score: int, read: int,
+                   dropped: int, not_interested: int) -> None:
+        """Refresh the edited row in the cached model and the tree in place.
+
+        The editable fields don't participate in the title/type/genre
+        filters, so the result set is unchanged and re-running the whole
+        search after every save would be wasted work.
+        """
+        target = int(mal_id)
+        for i, row in enumerate(self.manga_data):
+            if row[0] != target:
+                continue
+            patched = list(row)
+            patched[7] = user_score
+            patched[8] = read
+            patched[9] = dropped
+            patched[13] = not_interested
+            new_row = tuple(patched)
+            self.manga_data[i] = new_row
+            disp = self.build_display_row(new_row)
+            self.display_rows[i] = disp
+            iid = str(target)
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=disp[:11], tags=(disp[11],) if disp[11] else ())
+            return
 
     # -------------------------
     # Shutdown
     # -------------------------
     def on_close(self) -> None:
+        if self._worker_conn is not None:
+            # Close on the thread that owns it, then stop accepting work.
+            self.search_pool.submit(self._worker_conn.close)
+        self.search_pool.shutdown(wait=False)
+        self.img_pool.shutdown(wait=False)
         try:
             self.http.close()
         except Exception:
@@ -1,12 +1,50 @@
 import requests
 import json
 import os
+import sqlite3
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-from definitions import DEFAULT_OUTPUT_FILE
+from definitions import DEFAULT_OUTPUT_FILE, open_db
+from db.json_to_sqlite import make_row, make_genre_rows
+
+try:
+    import orjson  # C JSON codec; dumping/parsing the multi-MB dataset is CPU-bound in stdlib json
+except ImportError:
+    orjson = None
 
 JIKAN_API_URL = "https://api.jikan.moe/v4/manga"
+JIKAN_RATE_LIMIT = 3  # requests per second the API allows
+
+# Shared session: connection reuse across thousands of page fetches. The
+# adapter is sized for the worker pool so no thread ever waits on (or
+# re-handshakes) a pooled connection.
+SESSION = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=8, pool_maxsize=8))
+
+
+class RateLimiter:
+    """Minimal token-bucket limiter shared by the fetch workers."""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def acquire(self):
+        """Block until a request slot is available."""
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+LIMITER = RateLimiter(JIKAN_RATE_LIMIT)
 
 # Configure logger
 logger = logging.getLogger("dataset_scraper")
@@ -17,8 +55,12 @@ def load_existing_dataset():
     """Load dataset from file if present, returning entries and a set of MAL IDs."""
     if not os.path.exists(DEFAULT_OUTPUT_FILE):
         return [], set()
-    with open(DEFAULT_OUTPUT_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(DEFAULT_OUTPUT_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(DEFAULT_OUTPUT_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
     existing_ids = {entry["mal_id"] for entry in data}
     return data, existing_ids
 
@@ -33,78 +75,151 @@ def add_user_fields(entry):
     return entry
 
 
-def fetch_manga_page(page):
-    """Fetch a page of manga entries from the Jikan API with basic rate-limit handling."""
+def fetch_manga_page(page, max_attempts=6):
+    """Fetch a page of manga entries from the Jikan API.
+
+    429s are retried iteratively (bounded, no recursion) with exponential
+    backoff, honoring the server's Retry-After header when it sends one.
+    """
     url = f"{JIKAN_API_URL}?page={page}&limit=25&order_by=mal_id&sort=asc"
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()
-    elif response.status_code == 429:
-        logger.warning("Rate limit hit. Waiting for 2 seconds...")
-        time.sleep(2)
-        return fetch_manga_page(page)
-    else:
+    for attempt in range(max_attempts):
+        LIMITER.acquire()
+        response = SESSION.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code == 429:
+            wait = float(response.headers.get("Retry-After", 2 ** attempt))
+            logger.warning("Rate limit hit on page %s. Waiting %.0fs...", page, wait)
+            time.sleep(wait)
+            continue
         logger.error("Request failed [%s]: %s", response.status_code, response.text)
         return None
+    logger.error("Giving up on page %s after %d rate-limited attempts", page, max_attempts)
+    return None
 
 
 def scrape_all_manga(existing_ids):
-    """Fetch all manga entries not already present in the dataset."""
-    all_new = []
-    page = 1
-    pbar = tqdm(desc="Fetching manga from Jikan")
-
-    while True:
-        data = fetch_manga_page(page)
-        if not data or "data" not in data:
-            break
-
-        page_data = data["data"]
-        if not page_data:
-            break
+    """Fetch all manga entries not already present in the dataset.
+
+    Page 1 is probed first for the total page count; the remaining pages are
+    fetched concurrently by a small worker pool throttled to the API rate
+    limit, then merged back in page order so output stays deterministic.
+    """
+    first = fetch_manga_page(1)
+    if not first or "data" not in first:
+        return []
+    last_page = first.get("pagination", {}).get("last_visible_page", 1)
+    pages = {1: first["data"]}
+
+    with ThreadPoolExecutor(max_workers=JIKAN_RATE_LIMIT) as pool:
+        futures = {
+            pool.submit(fetch_manga_page, page): page
+            for page in range(2, last_page + 1)
+        }
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Fetching manga from Jikan"):
+            data = future.result()
+            if data and "data" in data:
+                pages[futures[future]] = data["data"]
 
-        for entry in page_data:
+    all_new = []
+    for page in sorted(pages):
+        for entry in pages[page]:
             if entry["mal_id"] not in existing_ids:
-                entry = add_user_fields(entry)
-                all_new.append(entry)
-
-        page += 1
-        pbar.update(1)
-        time.sleep(0.5)
-
-    pbar.close()
+                all_new.append(add_user_fields(entry))
     return all_new
 
 
-def merge_and_deduplicate(old_data, new_data):
-    """Merge old and new entries, preserving user_data where possible."""
-    combined = {entry["mal_id"]: entry for entry in old_data}
-    for entry in new_data:
-        if entry["mal_id"] in combined and "user_data" in combined[entry["mal_id"]]:
-            entry["user_data"] = combined[entry["mal_id"]]["user_data"]
-        else:
-            entry = add_user_fields(entry)
-        combined[entry["mal_id"]] = entry
-    return list(combined.values())
+# Metadata columns are refreshed on conflict; the user_* columns are
+# deliberately left alone so local ratings/flags survive re-scrapes (the job
+# merge_and_deduplicate used to do over the JSON file).
+SQL_UPSERT = """
+    INSERT INTO manga (
+        mal_id, title, type, mean_score, chapters, volumes, status,
+        genres, synopsis, images, image_url, published_date,
+        user_score, read, dropped, not_interested, has_blacklisted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(mal_id) DO UPDATE SET
+        title = excluded.title,
+        type = excluded.type,
+        mean_score = excluded.mean_score,
+        chapters = excluded.chapters,
+        volumes = excluded.volumes,
+        status = excluded.status,
+        genres = excluded.genres,
+        synopsis = excluded.synopsis,
+        images = excluded.images,
+        image_url = excluded.image_url,
+        published_date = excluded.published_date,
+        has_blacklisted = excluded.has_blacklisted
+"""
+
+
+def load_existing_ids():
+    """MAL ids already in the DB; dedup rides on the mal_id primary key."""
+    conn = open_db()
+    try:
+        return {row[0] for row in conn.execute("SELECT mal_id FROM manga")}
+    except sqlite3.OperationalError:
+        return set()  # fresh DB: everything is new
+    finally:
+        conn.close()
+
+
+def upsert_manga(entries):
+    """Upsert scraped entries into the manga DB in one transaction.
+
+    Incremental row writes replace the old rewrite-the-whole-JSON-file
+    cycle: only the pages that actually changed touch the pager.
+    """
+    conn = open_db()
+    try:
+        with conn:
+            conn.executemany(SQL_UPSERT, [make_row(e) for e in entries])
+            has_bridge = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='manga_genre'"
+            ).fetchone() is not None
+            if has_bridge:
+                conn.executemany(
+                    "DELETE FROM manga_genre WHERE mal_id = ?",
+                    [(e.get("mal_id"),) for e in entries],
+                )
+                conn.executemany(
+                    "INSERT INTO manga_genre (mal_id, genre) VALUES (?, ?)",
+                    [gr for e in entries for gr in make_genre_rows(e)],
+                )
+        logger.info("Upserted %d manga entries into the database", len(entries))
+    except sqlite3.OperationalError:
+        logger.exception(
+            "Upsert failed; DB schema may predate the current layout "
+            "(rebuild with db/json_to_sqlite.py)"
+        )
+    finally:
+        conn.close()
 
 
 def save_to_json(data, filename=DEFAULT_OUTPUT_FILE):
     """Write dataset to JSON file in a human-readable format."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson serializes straight to UTF-8 bytes in C, one buffer, no
+        # per-token Python work.
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     logger.info("Saved %d total manga entries to %s", len(data), filename)
 
 
 if __name__ == "__main__":
-    logger.info("Loading existing manga dataset...")
-    existing_data, existing_ids = load_existing_dataset()
+    logger.info("Loading existing manga ids from the database...")
+    existing_ids = load_existing_ids()
 
     logger.info("Scraping new manga entries from Jikan...")
     new_entries = scrape_all_manga(existing_ids)
 
     if new_entries:
-        logger.info("Found %d new manga entries. Merging and saving...", len(new_entries))
-        merged = merge_and_deduplicate(existing_data, new_entries)
-        save_to_json(merged)
+        logger.info("Found %d new manga entries. Upserting...", len(new_entries))
+        upsert_manga(new_entries)
     else:
         logger.info("No new entries found. Dataset is up to date.")
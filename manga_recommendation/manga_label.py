@@ -1,8 +1,8 @@
-import sqlite3
-import csv
 import logging
 
-from definitions import DB_PATH, LABELED_DATA_FILE  # Centralized project paths
+import pandas as pd
+
+from definitions import LABELED_DATA_FILE, open_db  # Centralized project paths
 
 # Configure logger
 logger = logging.getLogger("label_exporter")
@@ -15,6 +15,10 @@ def label_row(score, read, dropped, not_interested):
     - Positive (1): high score (>=8) or fully read (-1).
     - Negative (0): dropped, marked not interested, or low score (<=4).
     - None: unlabeled.
+
+    Reference implementation of the labeling rule (mirrored by the tests);
+    the exporter below evaluates the same rule in SQL so unlabeled rows
+    never leave the database.
     """
     if score is not None and score >= 8:
         return 1
@@ -25,55 +29,46 @@ def label_row(score, read, dropped, not_interested):
     return None
 
 
-def extract_labeled_data():
-    """Extract labeled rows from the manga DB for model training."""
-    labeled_rows = []
-
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT mal_id, title, type, genres, mean_score, chapters, volumes,
-                   user_score, read, dropped, not_interested
-            FROM manga
-        """)
+# SQL mirror of label_row: the WHERE keeps only labelable rows and the CASE
+# assigns the label, both evaluated in C inside sqlite, so neither the
+# unlabeled rows nor the per-row Python branching are paid.
+SQL_LABELED = """
+    SELECT mal_id, title, type, genres,
+           COALESCE(mean_score, 0) AS mean_score,
+           COALESCE(chapters, 0) AS chapters,
+           COALESCE(volumes, 0) AS volumes,
+           COALESCE(user_score, 0) AS user_score,
+           COALESCE(read, 0) AS read,
+           dropped, not_interested,
+           CASE
+               WHEN user_score >= 8 THEN 1
+               WHEN read = -1 THEN 1
+               ELSE 0
+           END AS label
+    FROM manga
+    WHERE user_score >= 8 OR read = -1
+       OR dropped = 1 OR not_interested = 1 OR user_score <= 4
+"""
 
-        for row in cursor.fetchall():
-            mal_id, title, type_, genres, mean_score, chapters, volumes, \
-            user_score, read, dropped, not_interested = row
 
-            label = label_row(user_score, read, dropped, not_interested)
-            if label is not None:
-                labeled_rows.append([
-                    mal_id,
-                    title,
-                    type_,
-                    genres,
-                    mean_score or 0,
-                    chapters or 0,
-                    volumes or 0,
-                    user_score or 0,
-                    read or 0,
-                    dropped,
-                    not_interested,
-                    label,
-                ])
+def export_to_csv(path=LABELED_DATA_FILE):
+    """Export labeled rows straight from the database to CSV via pandas.
 
-    return labeled_rows
-
-
-def export_to_csv(data, path=LABELED_DATA_FILE):
-    """Write labeled dataset to CSV for inspection/training."""
-    headers = [
-        "mal_id", "title", "type", "genres", "mean_score", "chapters", "volumes",
-        "user_score", "read", "dropped", "not_interested", "label",
-    ]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(data)
-    logger.info("Exported %d labeled entries to %s", len(data), path)
+    read_sql_query with a chunksize keeps memory bounded at one chunk while
+    to_csv does the row formatting and encoding in C; the column names come
+    from the SQL aliases, so the header needs no separate list.
+    """
+    conn = open_db()
+    count = 0
+    try:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            for chunk in pd.read_sql_query(SQL_LABELED, conn, chunksize=10_000):
+                chunk.to_csv(f, index=False, header=(count == 0))
+                count += len(chunk)
+    finally:
+        conn.close()
+    logger.info("Exported %d labeled entries to %s", count, path)
 
 
 if __name__ == "__main__":
-    data = extract_labeled_data()
-    export_to_csv(data)
+    export_to_csv()
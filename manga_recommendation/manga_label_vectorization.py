@@ -3,26 +3,29 @@ from __future__ import annotations
 import sqlite3
 import warnings
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.metrics import (
     RocCurveDisplay,
     accuracy_score,
     classification_report,
     roc_auc_score,
 )
-from sklearn.model_selection import StratifiedShuffleSplit, train_test_split
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
 
-from definitions import DB_PATH, LABELED_DATA_FILE, MODEL_PATH, GENRE_BLACKLIST
-from manga_recommendation.utils import GenreBinarizer  # custom transformer for list[str] genres
+from definitions import LABELED_DATA_FILE, MODEL_PATH, GENRE_BLACKLIST, open_db
+from manga_recommendation.utils import (  # custom transformers (genres, in-place IDF)
+    GenreBinarizer,
+    InplaceTfidfTransformer,
+)
 
 # -------------------------
 # Config
@@ -32,11 +35,27 @@ class TrainConfig:
     test_size: float = 0.25
     random_state: int = 42
     model_version: str = "rf-v1"
-    tfidf_max_features: int = 300
+    hash_features: int = 1024  # power of two so index hashing stays a bitmask
     n_estimators: int = 200  # a touch higher for stability
+    # Bound per-tree work: each tree sees half the rows and 10% of the
+    # features per split, and leaves of <5 samples stop splitting, keeping
+    # trees shallow and the fit working set small.
+    max_samples: float = 0.5
+    max_features: float = 0.1
+    min_samples_leaf: int = 5
 
 CONFIG = TrainConfig()
-BL_LOWER = {g.lower() for g in GENRE_BLACKLIST}
+BL_LOWER = frozenset(g.lower() for g in GENRE_BLACKLIST)
+
+# Physical cores only: tree building is memory-bound, and scheduling a
+# worker per SMT sibling just thrashes the shared caches.
+N_PHYS_CORES = joblib.cpu_count(only_physical_cores=True) or 1
+
+try:
+    import lz4  # noqa: F401  # joblib resolves the codec by name at dump time
+    _DUMP_COMPRESS: Tuple[str, int] = ("lz4", 3)
+except ImportError:
+    _DUMP_COMPRESS = ("zlib", 1)  # light compression beats the default heavy zlib
 
 # -------------------------
 # Labeling logic
@@ -56,74 +75,103 @@ def label_row(score: Optional[int], read: Optional[int], dropped: Optional[int],
         return 0
     return None
 
-def _split_genres(s: Optional[str]) -> List[str]:
+def _parse_genres(s: Optional[str]) -> List[str]:
+    """Split a genres string and drop blacklisted entries in one pass.
+
+    Fused split+clean: each token is stripped, lowercased and checked
+    against the blacklist exactly once, with no intermediate list.
+    """
     if not s:
         return []
-    return [g.strip() for g in s.split(",") if g.strip()]
-
-def _clean_genres_for_training(genres: Iterable[str]) -> List[str]:
-    """Remove blacklisted genres so the encoder never sees them."""
-    return [g for g in genres if g and g.lower() not in BL_LOWER]
+    out = []
+    for tok in s.split(","):
+        t = tok.strip()
+        if t and t.lower() not in BL_LOWER:
+            out.append(t)
+    return out
 
 # -------------------------
 # Data extraction
 # -------------------------
+_EXTRACT_SQL = """
+    SELECT mal_id, title, type, genres, mean_score, chapters, volumes,
+           user_score, read, dropped, not_interested, synopsis
+    FROM manga
+"""
+
+_CONN: Optional[sqlite3.Connection] = None
+
+def _get_conn() -> sqlite3.Connection:
+    """Lazily opened, long-lived read connection.
+
+    Repeated extractions (CV runs, hyperparameter sweeps) reuse the same
+    connection so sqlite's page cache stays warm, and mmap serves pages
+    straight from the OS cache without copies. Opened lazily so importing
+    this module never touches the database (tests repoint DB_PATH).
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = open_db(check_same_thread=False)
+        _CONN.execute("PRAGMA mmap_size=268435456")
+    return _CONN
+
+def _label_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the vectorized labeling rule to one chunk of manga rows.
+
+    Mask form of label_row: fillna sentinels keep NULL scores out of both
+    the positive and negative branches, matching the `is not None` checks.
+    """
+    score = df["user_score"]
+    positive = (score.fillna(-1) >= 8) | (df["read"] == -1)
+    negative = (
+        (df["dropped"] == 1)
+        | (df["not_interested"] == 1)
+        | (score.fillna(99) <= 4)
+    )
+    df["label"] = np.where(positive, 1, np.where(negative, 0, np.nan))
+    df = df.dropna(subset=["label"])
+
+    return pd.DataFrame(
+        {
+            "mal_id": df["mal_id"],
+            "title": df["title"],
+            "type": df["type"].fillna(""),
+            "genre_list": df["genres"].map(_parse_genres),
+            "mean_score": df["mean_score"].fillna(0.0).astype(np.float32),
+            "chapters": df["chapters"].fillna(0).astype(np.int32),
+            "volumes": df["volumes"].fillna(0).astype(np.int32),
+            # Lowercased here in one vectorized pass so the hashing
+            # vectorizer can skip its per-document lowercase callback.
+            "synopsis": df["synopsis"].fillna("").str.lower(),
+            "label": df["label"].astype(int),
+        }
+    ).reset_index(drop=True)
+
 def extract_labeled_data() -> pd.DataFrame:
     """
     Pulls user-labeled signals from the DB and returns a supervised dataset with:
     [type, genre_list, mean_score, chapters, volumes, synopsis] + label
-    """
-    with sqlite3.connect(DB_PATH) as conn:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT mal_id, title, type, genres, mean_score, chapters, volumes,
-                   user_score, read, dropped, not_interested, synopsis
-            FROM manga
-            """
-        )
-        rows = cur.fetchall()
-
-    labeled_rows: List[dict] = []
-    for (
-        mal_id,
-        title,
-        type_,
-        genres,
-        mean_score,
-        chapters,
-        volumes,
-        user_score,
-        read,
-        dropped,
-        not_interested,
-        synopsis,
-    ) in rows:
-        y = label_row(user_score, read, dropped, not_interested)
-        if y is None:
-            continue
-
-        genres_list = _clean_genres_for_training(_split_genres(genres))
-        labeled_rows.append(
-            {
-                "mal_id": mal_id,
-                "title": title,
-                "type": type_ or "",
-                "genre_list": genres_list,
-                "mean_score": float(mean_score or 0.0),
-                "chapters": int(chapters or 0),
-                "volumes": int(volumes or 0),
-                "synopsis": synopsis or "",
-                "label": int(y),
-            }
-        )
 
-    df = pd.DataFrame(labeled_rows)
-    return df
+    Rows stream out of sqlite in 5000-row chunks that are labeled and
+    filtered as they arrive, so peak memory is the (small) labeled subset
+    plus one chunk rather than the whole table.
+    """
+    parts = [
+        _label_chunk(chunk)
+        for chunk in pd.read_sql_query(_EXTRACT_SQL, _get_conn(), chunksize=5000)
+    ]
+    parts = [p for p in parts if not p.empty]
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, ignore_index=True, copy=False)
 
 # -------------------------
 # Training
 # -------------------------
+def _to_float32(a):
+    """Module-level (picklable) float32 cast for the numeric sub-pipeline."""
+    return a.astype(np.float32, copy=False)
+
 def _print_class_balance(y: pd.Series) -> None:
     counts = y.value_counts(dropna=False).to_dict()
     total = int(y.shape[0])
@@ -140,12 +188,36 @@ def build_pipeline() -> Pipeline:
       - TfidfVectorizer on raw "synopsis" text
       - RandomForestClassifier
     """
+    # Every transformer emits sparse (with_mean=False keeps the scaler
+    # sparse-compatible), so the ColumnTransformer hstacks one CSR instead
+    # of densifying the 99%-zero genre/TF-IDF blocks; RandomForest accepts
+    # sparse input directly.
     pre = ColumnTransformer(
         transformers=[
             ("genres", GenreBinarizer(), "genre_list"),
-            ("type", OneHotEncoder(sparse_output=False, handle_unknown="ignore"), ["type"]),
-            ("scale", StandardScaler(), ["mean_score", "chapters", "volumes"]),
-            ("synopsis", TfidfVectorizer(max_features=CONFIG.tfidf_max_features), "synopsis"),
+            ("type", OneHotEncoder(sparse_output=True, handle_unknown="ignore",
+                                   dtype=np.float32), ["type"]),
+            # StandardScaler upcasts to float64 internally; cast back so the
+            # dense numeric block matches the float32 sparse blocks (tree
+            # splits do not need the extra precision).
+            ("scale", Pipeline([
+                ("scale", StandardScaler(with_mean=False)),
+                ("f32", FunctionTransformer(_to_float32)),
+            ]), ["mean_score", "chapters", "volumes"]),
+            # Hashing instead of TfidfVectorizer skips the vocabulary-build
+            # pass (and its big token-count dict); alternate_sign keeps
+            # counts non-negative for the IDF step, float32 halves the
+            # feature bytes.
+            ("synopsis", Pipeline([
+                ("hash", HashingVectorizer(
+                    n_features=CONFIG.hash_features,
+                    alternate_sign=False,
+                    norm=None,
+                    dtype=np.float32,
+                    lowercase=False,  # synopses arrive pre-lowercased
+                )),
+                ("idf", InplaceTfidfTransformer(sublinear_tf=True)),
+            ]), "synopsis"),
         ],
         remainder="drop",
         verbose_feature_names_out=False,
@@ -153,15 +225,26 @@ def build_pipeline() -> Pipeline:
 
     clf = RandomForestClassifier(
         n_estimators=CONFIG.n_estimators,
+        max_samples=CONFIG.max_samples,
+        max_features=CONFIG.max_features,
+        min_samples_leaf=CONFIG.min_samples_leaf,
         random_state=CONFIG.random_state,
-        n_jobs=-1,
+        n_jobs=N_PHYS_CORES,
     )
 
+    # Memoize the preprocessor's fit on disk: joblib keys on the step's
+    # parameters and the input data, so re-training runs that only change
+    # classifier settings skip re-fitting TF-IDF and friends entirely (the
+    # final estimator is never cached). Delete the cache directory when
+    # GenreBinarizer's code changes — joblib does not hash source.
+    memory = joblib.Memory(location=str(MODEL_PATH.parent / ".sk_cache"), verbose=0)
+
     pipe = Pipeline(
         steps=[
             ("preprocess", pre),
             ("classifier", clf),
-        ]
+        ],
+        memory=memory,
     )
     return pipe
 
@@ -180,23 +263,22 @@ def train_model(df: pd.DataFrame) -> Pipeline:
     if len(classes) < 2:
         raise ValueError("Need at least two classes to train. Collected only: " + str(classes))
 
-    # Stratified split (fallback to regular split if it fails due to tiny minority)
+    # Stratified split (fallback to regular split if it fails due to tiny
+    # minority). The splitters yield index arrays, so the frame is sliced
+    # once with .iloc instead of train_test_split deep-copying it twice.
     try:
-        X_train, X_test, y_train, y_test = train_test_split(
-            features,
-            labels,
-            test_size=CONFIG.test_size,
-            stratify=labels,
-            random_state=CONFIG.random_state,
+        sss = StratifiedShuffleSplit(
+            n_splits=1, test_size=CONFIG.test_size, random_state=CONFIG.random_state
         )
+        (train_idx, test_idx), = sss.split(np.zeros(len(labels)), labels)
     except ValueError:
         # Fallback: no stratify
-        X_train, X_test, y_train, y_test = train_test_split(
-            features,
-            labels,
-            test_size=CONFIG.test_size,
-            random_state=CONFIG.random_state,
+        ss = ShuffleSplit(
+            n_splits=1, test_size=CONFIG.test_size, random_state=CONFIG.random_state
         )
+        (train_idx, test_idx), = ss.split(np.zeros(len(labels)))
+    X_train, X_test = features.iloc[train_idx], features.iloc[test_idx]
+    y_train, y_test = labels.iloc[train_idx], labels.iloc[test_idx]
 
     pipeline = build_pipeline()
 
@@ -229,13 +311,23 @@ if __name__ == "__main__":
     if df.empty:
         raise SystemExit("No labeled rows found. Add a few ratings/drops to generate training data.")
 
-    # Persist the supervised dataset for inspection
-    pd.DataFrame(df).to_csv(LABELED_DATA_FILE, index=False, encoding="utf-8")
-    print(f"📁 Exported {len(df)} labeled entries to {LABELED_DATA_FILE}")
+    # Persist the supervised dataset for inspection. Parquet round-trips
+    # the genre_list column losslessly (CSV goes through repr) and writes
+    # compressed columnar pages; fall back to CSV without pyarrow.
+    LABELED_DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        dataset_path = LABELED_DATA_FILE.with_suffix(".parquet")
+        df.to_parquet(dataset_path, engine="pyarrow", compression="zstd", index=False)
+    except ImportError:
+        dataset_path = LABELED_DATA_FILE
+        df.to_csv(dataset_path, index=False, encoding="utf-8")
+    print(f"📁 Exported {len(df)} labeled entries to {dataset_path}")
 
     model = train_model(df)
 
     # Ensure parent directory exists and save
     MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(model, MODEL_PATH)
+    # protocol 5 writes the tree arrays as out-of-band buffers (no copy);
+    # lz4 when installed makes compression nearly free, zlib-1 otherwise.
+    joblib.dump(model, MODEL_PATH, compress=_DUMP_COMPRESS, protocol=5)
     print(f"✅ Model trained and saved to {MODEL_PATH} (version={CONFIG.model_version})")
@@ -0,0 +1,50 @@
+import numpy as np
+from collections import Counter
+
+# Mirrors compute_match_scores in gui/manga_recommender_simple.py (the GUI
+# module imports tkinter/matplotlib, so the logic is replicated here like
+# the other mirrored tests).
+def compute_match_scores(genre_strings, genre_counter):
+    genre_index = {g: i for i, g in enumerate(genre_counter)}
+    weights_vec = np.array(
+        [genre_counter[g] for g in genre_index], dtype=np.float32
+    )
+    col_idx = []
+    row_ptr = [0]
+    for genres_str in genre_strings:
+        if genres_str:
+            col_idx.extend(
+                genre_index[g] for g in genres_str.split(", ") if g in genre_index
+            )
+        row_ptr.append(len(col_idx))
+    n_rows = len(row_ptr) - 1
+    col_idx = np.asarray(col_idx, dtype=np.int32)
+    if not col_idx.size:
+        return np.zeros(n_rows, dtype=np.float32)
+    row_ids = np.repeat(np.arange(n_rows), np.diff(row_ptr))
+    return np.bincount(
+        row_ids, weights=weights_vec[col_idx], minlength=n_rows
+    ).astype(np.float32)
+
+def test_trailing_empty_genres_keep_preceding_score():
+    # Regression: with reduceat, a genre-less candidate after the last
+    # matching one truncated that candidate's summed weights (15 -> 10).
+    counter = Counter({"Action": 10, "Fantasy": 5})
+    scores = compute_match_scores(["Action, Fantasy", None], counter)
+    assert scores.tolist() == [15.0, 0.0]
+
+def test_empty_and_unknown_genres_score_zero():
+    counter = Counter({"Action": 10})
+    scores = compute_match_scores([None, "", "Unknown", "Action"], counter)
+    assert scores.tolist() == [0.0, 0.0, 0.0, 10.0]
+
+def test_interleaved_empty_rows_do_not_shift_sums():
+    counter = Counter({"Action": 10, "Fantasy": 5, "Romance": 2})
+    scores = compute_match_scores(
+        [None, "Action", None, "Fantasy, Romance", None], counter
+    )
+    assert scores.tolist() == [0.0, 10.0, 0.0, 7.0, 0.0]
+
+def test_all_empty_returns_zeros():
+    scores = compute_match_scores([None, ""], Counter({"Action": 10}))
+    assert scores.tolist() == [0.0, 0.0]